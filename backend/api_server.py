@@ -7,10 +7,12 @@ import os
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from pathlib import Path
 from typing import Optional
 import uvicorn
+import anyio.to_thread
 import traceback
 import random
 import re
@@ -19,8 +21,15 @@ from pokemon_generator import PokeDream
 from src.pokedex_db import get_db
 from src.daily_challenges import generate_daily_challenge, get_challenge_db
 from src.tournament_system import get_tournament_system
+from src.tournament_scheduler import get_tournament_scheduler
 from src.voting_system import get_voting_system
 from src.hall_of_fame import get_hall_of_fame
+from src.fan_favorites import get_fan_favorites
+from src.ratings import get_ratings
+from src.battle_engine import get_battle_engine
+from src.damage_matrix import get_damage_matrix
+from src.power_rankings import get_power_rankings
+from src.tally_broadcaster import TallyBroadcaster
 
 # ==================== RANDOM GENERATION POOLS ====================
 
@@ -128,31 +137,96 @@ if public_dir.exists():
 
 generator = PokeDream()
 
+# Live tally stream: one broadcaster shared by every SSE subscriber
+tally_broadcaster = TallyBroadcaster(
+    read_tally=lambda matchup_id: get_tournament_system().get_matchup_tally(matchup_id)
+)
+
 # ==================== AUTO-CREATE TOURNAMENT ON STARTUP ====================
 
 @app.on_event("startup")
 async def startup_event():
-    """Auto-create tournament if none exists."""
+    """Link live tallies and listeners, catch up tournaments, archive finished tournaments' votes and start the scheduler."""
+    # Sync endpoints run in this threadpool; the stores are safe to share across it
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = int(os.getenv("THREADPOOL_SIZE", 64))
+
+    # Keep bracket tallies materialized as votes arrive. Every listener is
+    # linked before the catch-up tick below, so rounds it decides use current
+    # tallies and their results reach fan favorites and ratings.
+    tournament_system = get_tournament_system()
+    voting_system = get_voting_system()
+    tournament_system.sync_tallies(voting_system)
+    voting_system.subscribe(tournament_system.record_vote)
+
+    # Keep Fan Favorite aggregates materialized as votes land and tournaments close
+    fan_favorites = get_fan_favorites()
+    fan_favorites.rebuild(tournament_system, voting_system)
+    voting_system.subscribe(fan_favorites.record_vote)
+    tournament_system.subscribe(fan_favorites.record_tournament)
+
+    # Rate Pokémon on every resolved matchup (and, if enabled, every vote)
+    ratings = get_ratings()
+    tournament_system.subscribe(ratings.record_tournament)
+    if ratings.vote_k_factor:
+        def rate_vote(matchup_id: str, pokemon_id: int):
+            opponent = tournament_system.get_opponent(matchup_id, pokemon_id)
+            if opponent is not None:
+                ratings.record_vote(pokemon_id, opponent)
+
+        voting_system.subscribe(rate_vote)
+
     try:
-        tournament_system = get_tournament_system()
-        current = tournament_system.get_current_tournament()
+        tournament_system.ensure_participant_trainers(get_db())
 
-        if not current:
-            db = get_db()
-            pokemon_count = db.get_count()
-
-            # Only create if we have at least 16 Pokémon
-            if pokemon_count >= 16:
-                tournament = tournament_system.create_tournament(db)
-                print(f"✓ Auto-created tournament: {tournament['id']}")
-                print(f"  Participants: {len(tournament['participants'])} Pokémon")
-            else:
-                print(f"⚠ Need at least 16 Pokémon to create tournament (current: {pokemon_count})")
-        else:
+        # Catch up on rounds that closed while the server was down and
+        # start a tournament if none is running
+        get_tournament_scheduler().tick()
+
+        current = tournament_system.get_current_tournament()
+        if current:
             print(f"✓ Active tournament exists: {current['id']}")
     except Exception as e:
         print(f"⚠ Failed to auto-create tournament: {e}")
 
+    try:
+        # Seal votes and archive brackets of finished tournaments so only the active one stays hot
+        for tournament in tournament_system.get_finished_tournaments():
+            if voting_system.seal_tournament(tournament["id"]):
+                print(f"✓ Archived votes for tournament: {tournament['id']}")
+            if tournament_system.archive_tournament(tournament["id"]):
+                print(f"✓ Archived tournament: {tournament['id']}")
+    except Exception as e:
+        print(f"⚠ Failed to archive tournament votes: {e}")
+
+    # Precompute matchup damage for the whole Pokédex and extend it as Pokémon are added
+    db = get_db()
+    damage_matrix = get_damage_matrix()
+    damage_matrix.build(db.get_all())
+    db.subscribe(damage_matrix.add_pokemon)
+
+    # Play round-robin battles for new Pokémon in the background
+    get_power_rankings().start(db.get_all)
+
+    # Push coalesced tally deltas to live viewers
+    tally_broadcaster.prime(tournament_system.get_live_tallies())
+    voting_system.subscribe(tally_broadcaster.mark_dirty)
+    tally_broadcaster.start()
+
+    # Advance rounds and roll over tournaments on schedule from here on
+    get_tournament_scheduler().start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the background jobs and tally stream and flush queued votes, tallies and ratings to disk before the process exits."""
+    get_tournament_scheduler().stop()
+    get_power_rankings().stop()
+    await tally_broadcaster.stop()
+    get_voting_system().close()
+    get_tournament_system().flush()
+    get_ratings().flush()
+
 # ==================== REQUEST MODELS ====================
 
 class GenerateRequest(BaseModel):
@@ -194,6 +268,16 @@ class VoteRequest(BaseModel):
     pokemon_id: int
 
 
+class BatchVoteItem(BaseModel):
+    matchup_id: str
+    pokemon_id: int
+
+
+class BatchVoteRequest(BaseModel):
+    trainer_id: str
+    votes: list[BatchVoteItem]
+
+
 class InductChampionRequest(BaseModel):
     pokemon_id: int
     tournament_id: str
@@ -201,6 +285,11 @@ class InductChampionRequest(BaseModel):
     creator_quote: str | None = None
 
 
+class InductFanFavoriteRequest(BaseModel):
+    pokemon_id: int
+    creator_quote: str | None = None
+
+
 class InductProfessorsChoiceRequest(BaseModel):
     pokemon_id: int
     reason: str
@@ -230,13 +319,10 @@ def complete_daily_challenge(req: CompleteChallengeRequest):
     challenge = generate_daily_challenge()
     challenge_db = get_challenge_db()
 
-    # Check if already completed
-    if challenge_db.has_completed(req.trainer_id, challenge["id"]):
+    # Mark as completed (atomically rejects a second completion)
+    if not challenge_db.mark_completed(req.trainer_id, challenge["id"], req.pokemon_id):
         return {"success": False, "message": "Challenge already completed today"}
 
-    # Mark as completed
-    challenge_db.mark_completed(req.trainer_id, challenge["id"], req.pokemon_id)
-
     return {"success": True, "message": "Challenge completed!", "challenge_id": challenge["id"]}
 
 
@@ -288,7 +374,7 @@ def generate_pokemon(req: GenerateRequest):
             try:
                 challenge_db = get_challenge_db()
                 challenge_db.mark_completed(req.trainer_id, req.challenge_id, pokemon.get("id", ""))
-                pokemon["challenge_completed"] = True
+                db.mark_challenge_completed(pokemon["dex_number"])
             except Exception as e:
                 print(f"Failed to mark challenge complete: {e}")
 
@@ -369,7 +455,7 @@ def quick_generate(req: QuickGenerateRequest):
             try:
                 challenge_db = get_challenge_db()
                 challenge_db.mark_completed(req.trainer_id, req.challenge_id, pokemon.get("id", ""))
-                pokemon["challenge_completed"] = True
+                db.mark_challenge_completed(pokemon["dex_number"])
             except Exception as e:
                 print(f"Failed to mark challenge complete: {e}")
 
@@ -605,34 +691,8 @@ def get_current_tournament():
     if not tournament:
         return {"tournament": None, "message": "No active tournament"}
 
-    # Enrich with actual Pokémon data
-    db = get_db()
-    enriched_bracket = {}
-
-    for round_key, matchups in tournament["bracket"].items():
-        enriched_matchups = []
-
-        for matchup in matchups:
-            pokemon_a = None
-            pokemon_b = None
-
-            if matchup["pokemon_a_id"]:
-                pokemon_a = db.get_by_dex_number(matchup["pokemon_a_id"])
-
-            if matchup["pokemon_b_id"]:
-                pokemon_b = db.get_by_dex_number(matchup["pokemon_b_id"])
-
-            enriched_matchups.append({
-                **matchup,
-                "pokemon_a": pokemon_a,
-                "pokemon_b": pokemon_b
-            })
-
-        enriched_bracket[round_key] = enriched_matchups
-
-    tournament["bracket"] = enriched_bracket
-
-    return {"tournament": tournament}
+    # Enrich with actual Pokémon data (cached, batched view)
+    return {"tournament": tournament_system.get_bracket_view(tournament, get_db())}
 
 
 @app.get("/api/tournament/current/matchups")
@@ -648,7 +708,7 @@ def get_current_matchups(trainer_id: Optional[str] = None):
 
     matchups = tournament_system.get_active_matchups(tournament["id"])
 
-    # Enrich with Pokémon data and vote counts
+    # Enrich with Pokémon data (vote counts are kept live on the matchup)
     db = get_db()
     enriched_matchups = []
 
@@ -656,11 +716,6 @@ def get_current_matchups(trainer_id: Optional[str] = None):
         pokemon_a = db.get_by_dex_number(matchup["pokemon_a_id"])
         pokemon_b = db.get_by_dex_number(matchup["pokemon_b_id"])
 
-        # Get vote counts
-        votes = voting_system.get_matchup_votes(matchup["matchup_id"])
-        votes_a = votes.get(matchup["pokemon_a_id"], 0)
-        votes_b = votes.get(matchup["pokemon_b_id"], 0)
-
         # Check if trainer has voted
         has_voted = False
         if trainer_id:
@@ -670,8 +725,8 @@ def get_current_matchups(trainer_id: Optional[str] = None):
             "matchup_id": matchup["matchup_id"],
             "pokemon_a": pokemon_a,
             "pokemon_b": pokemon_b,
-            "votes_a": votes_a,
-            "votes_b": votes_b,
+            "votes_a": matchup["votes_a"],
+            "votes_b": matchup["votes_b"],
             "has_voted": has_voted,
             "status": matchup["status"]
         })
@@ -689,29 +744,41 @@ def get_current_matchups(trainer_id: Optional[str] = None):
     }
 
 
+@app.get("/api/tournament/current/stream")
+async def stream_current_tallies():
+    """
+    Server-Sent Events stream of live matchup tallies.
+
+    Sends a "snapshot" event on connect, then "tally" events with per-matchup
+    totals and deltas, coalesced into ticks of a few hundred milliseconds.
+    """
+    tournament_system = get_tournament_system()
+
+    return StreamingResponse(
+        tally_broadcaster.subscribe(initial=tournament_system.get_live_tallies()),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.post("/api/tournament/vote")
 def cast_tournament_vote(req: VoteRequest):
     """Cast a vote in a tournament matchup."""
     voting_system = get_voting_system()
     tournament_system = get_tournament_system()
 
-    # Verify tournament exists and is active
-    tournament = tournament_system.get_current_tournament()
-    if not tournament:
-        raise HTTPException(status_code=404, detail="No active tournament")
+    # Verify matchup exists, is active and its tournament is open
+    target = tournament_system.get_vote_target(req.matchup_id)
 
-    # Verify matchup exists and is active
-    matchups = tournament_system.get_active_matchups(tournament["id"])
-    matchup = next((m for m in matchups if m["matchup_id"] == req.matchup_id), None)
-
-    if not matchup:
+    if not target:
         raise HTTPException(status_code=404, detail="Matchup not found or not active")
 
-    # Verify trainer isn't voting on their own Pokémon
-    db = get_db()
-    pokemon = db.get_by_dex_number(req.pokemon_id)
+    # Verify the Pokémon is in this matchup
+    if req.pokemon_id not in target["owners"]:
+        raise HTTPException(status_code=400, detail="Pokémon is not in this matchup")
 
-    if pokemon and pokemon.get("trainer_id") == req.trainer_id:
+    # Verify trainer isn't voting on their own Pokémon
+    if target["owners"][req.pokemon_id] == req.trainer_id:
         raise HTTPException(status_code=400, detail="You cannot vote for your own Pokémon")
 
     # Cast vote
@@ -727,13 +794,64 @@ def cast_tournament_vote(req: VoteRequest):
     return result
 
 
+@app.post("/api/tournament/vote/batch")
+def cast_tournament_votes(req: BatchVoteRequest):
+    """Cast a trainer's picks for every matchup in the current round at once."""
+    voting_system = get_voting_system()
+    tournament_system = get_tournament_system()
+
+    results = [None] * len(req.votes)
+    picks = []
+    pick_positions = []
+
+    for i, item in enumerate(req.votes):
+        target = tournament_system.get_vote_target(item.matchup_id)
+
+        if not target:
+            message = "Matchup not found or not active"
+        elif item.pokemon_id not in target["owners"]:
+            message = "Pokémon is not in this matchup"
+        elif target["owners"][item.pokemon_id] == req.trainer_id:
+            message = "You cannot vote for your own Pokémon"
+        else:
+            picks.append({"matchup_id": item.matchup_id, "pokemon_id": item.pokemon_id})
+            pick_positions.append(i)
+            continue
+
+        results[i] = {"matchup_id": item.matchup_id, "success": False, "message": message}
+
+    # Record all valid picks together so they are persisted in one write
+    for i, result in zip(pick_positions, voting_system.cast_votes(req.trainer_id, picks)):
+        results[i] = result
+
+    accepted = sum(1 for r in results if r["success"])
+
+    return {
+        "success": accepted > 0,
+        "accepted": accepted,
+        "rejected": len(results) - accepted,
+        "results": results
+    }
+
+
 @app.get("/api/tournament/history")
-def get_tournament_history(limit: int = 10):
-    """Get past tournaments."""
+def get_tournament_history(limit: int = 10, offset: int = 0):
+    """Get past tournament summaries, newest first."""
     tournament_system = get_tournament_system()
-    tournaments = tournament_system.get_tournament_history(limit)
 
-    return {"tournaments": tournaments}
+    if limit < 1:
+        raise HTTPException(status_code=400, detail="limit must be at least 1")
+    if offset < 0:
+        raise HTTPException(status_code=400, detail="offset must not be negative")
+
+    tournaments = tournament_system.get_tournament_history(limit, offset)
+
+    return {
+        "tournaments": tournaments,
+        "total": tournament_system.get_tournament_count(),
+        "limit": limit,
+        "offset": offset
+    }
 
 
 @app.get("/api/tournament/{tournament_id}")
@@ -745,34 +863,42 @@ def get_tournament_details(tournament_id: str):
     if not tournament:
         raise HTTPException(status_code=404, detail="Tournament not found")
 
-    # Enrich with Pokémon data
-    db = get_db()
-    enriched_bracket = {}
+    # Enrich with Pokémon data (cached, batched view)
+    return {"tournament": tournament_system.get_bracket_view(tournament, get_db())}
 
-    for round_key, matchups in tournament["bracket"].items():
-        enriched_matchups = []
 
-        for matchup in matchups:
-            pokemon_a = None
-            pokemon_b = None
+@app.get("/api/ratings")
+def get_rating_leaderboard(limit: int = 100, offset: int = 0):
+    """Get Pokémon ranked by Elo rating, best first."""
+    ratings = get_ratings()
+    db = get_db()
+
+    if limit < 1:
+        raise HTTPException(status_code=400, detail="limit must be at least 1")
+    if offset < 0:
+        raise HTTPException(status_code=400, detail="offset must not be negative")
 
-            if matchup["pokemon_a_id"]:
-                pokemon_a = db.get_by_dex_number(matchup["pokemon_a_id"])
+    ranked = ratings.get_top(limit, offset)
+    pokemon = db.get_many(r["pokemon_id"] for r in ranked)
 
-            if matchup["pokemon_b_id"]:
-                pokemon_b = db.get_by_dex_number(matchup["pokemon_b_id"])
+    return {
+        "ratings": [{**r, "pokemon": pokemon.get(r["pokemon_id"])} for r in ranked],
+        "total": ratings.get_count(),
+        "limit": limit,
+        "offset": offset
+    }
 
-            enriched_matchups.append({
-                **matchup,
-                "pokemon_a": pokemon_a,
-                "pokemon_b": pokemon_b
-            })
 
-        enriched_bracket[round_key] = enriched_matchups
+@app.get("/api/ratings/{pokemon_id}")
+def get_pokemon_rating(pokemon_id: int):
+    """Get a Pokémon's Elo rating and rank."""
+    ratings = get_ratings()
 
-    tournament["bracket"] = enriched_bracket
+    rank = ratings.get_rank(pokemon_id)
+    if not rank:
+        raise HTTPException(status_code=404, detail="Pokémon has no rating yet")
 
-    return {"tournament": tournament}
+    return {**rank, "total": ratings.get_count()}
 
 
 @app.get("/api/trainer/{trainer_id}/tournament-stats")
@@ -785,19 +911,19 @@ def get_trainer_tournament_stats(trainer_id: str):
     # Get voting stats
     voting_stats = voting_system.get_trainer_voting_stats(trainer_id)
 
-    # Get Pokémon in tournaments
-    trainer_pokemon = db.get_by_trainer(trainer_id)
+    # Get the trainer's Pokémon in the current tournament
     tournament = tournament_system.get_current_tournament()
 
     pokemon_in_current = []
     if tournament:
-        for pokemon in trainer_pokemon:
-            if pokemon["dex_number"] in tournament["participants"]:
-                # Get vote count
-                total_votes = voting_system.get_pokemon_total_votes(pokemon["dex_number"])
+        entrants = tournament_system.get_trainer_entrants(trainer_id, tournament["id"])
+        pokemon = db.get_many(entrants)
+
+        for dex_number in entrants:
+            if dex_number in pokemon:
                 pokemon_in_current.append({
-                    **pokemon,
-                    "total_votes": total_votes
+                    **pokemon[dex_number],
+                    "total_votes": voting_system.get_pokemon_total_votes(dex_number)
                 })
 
     return {
@@ -806,35 +932,127 @@ def get_trainer_tournament_stats(trainer_id: str):
     }
 
 
+# ==================== BATTLE ENDPOINTS ====================
+
+@app.get("/api/battle/simulate")
+def simulate_battle(a: int, b: int, simulations: int = 2000, seed: Optional[int] = None):
+    """
+    Simulate battles between two Pokémon and return win probabilities.
+
+    Query params:
+        a: Dex number of the first Pokémon
+        b: Dex number of the second Pokémon
+        simulations: Number of Monte Carlo battles (1-20000)
+        seed: Optional RNG seed for reproducible results
+    """
+    if not 1 <= simulations <= 20000:
+        raise HTTPException(status_code=400, detail="simulations must be between 1 and 20000")
+
+    db = get_db()
+    pokemon_a = db.get_by_dex_number(a)
+    pokemon_b = db.get_by_dex_number(b)
+    if not pokemon_a or not pokemon_b:
+        raise HTTPException(status_code=404, detail="Pokémon not found")
+
+    return get_battle_engine().simulate(pokemon_a, pokemon_b, simulations, seed)
+
+
+@app.get("/api/battle/counters/{dex_number}")
+def get_counters(dex_number: int, limit: int = 10):
+    """
+    Get the best counters to a Pokémon from the precomputed damage matrix.
+
+    Counters are ranked by expected damage dealt to the Pokémon minus
+    expected damage taken from it, both as fractions of HP.
+    """
+    db = get_db()
+    if not db.get_by_dex_number(dex_number):
+        raise HTTPException(status_code=404, detail="Pokémon not found")
+
+    counters = get_damage_matrix().get_counters(dex_number, limit)
+    pokemon = db.get_many(c["pokemon_id"] for c in counters)
+    return {
+        "dex_number": dex_number,
+        "counters": [{**c, "pokemon": pokemon.get(c["pokemon_id"])} for c in counters]
+    }
+
+
+@app.get("/api/battle/threatens/{dex_number}")
+def get_threatened(dex_number: int, limit: int = 10):
+    """Get the Pokémon a Pokémon hits hardest, by expected damage as a fraction of their HP."""
+    db = get_db()
+    if not db.get_by_dex_number(dex_number):
+        raise HTTPException(status_code=404, detail="Pokémon not found")
+
+    threatened = get_damage_matrix().get_threatened(dex_number, limit)
+    pokemon = db.get_many(t["pokemon_id"] for t in threatened)
+    return {
+        "dex_number": dex_number,
+        "threatens": [{**t, "pokemon": pokemon.get(t["pokemon_id"])} for t in threatened]
+    }
+
+
+
+@app.get("/api/power-rankings")
+def get_power_ranking_table(tier: str = None, type: str = None, limit: int = 50, offset: int = 0):
+    """
+    Get round-robin power rankings, overall or within a tier or type.
+
+    Query params:
+        tier: Rank only Pokémon of this tier
+        type: Rank only Pokémon of this type
+        limit: Page size
+        offset: Number of ranked Pokémon to skip
+    """
+    power_rankings = get_power_rankings()
+    rankings, total = power_rankings.get_rankings(tier, type, limit, offset)
+    pokemon = get_db().get_many(r["pokemon_id"] for r in rankings)
+
+    return {
+        "rankings": [{**r, "pokemon": pokemon.get(r["pokemon_id"])} for r in rankings],
+        "total": total,
+        "scope": power_rankings.scope,
+        "updated_at": power_rankings.updated_at,
+        "limit": limit,
+        "offset": offset
+    }
+
 # ==================== HALL OF FAME ENDPOINTS ====================
 
 @app.get("/api/hall-of-fame")
-def get_hall_of_fame_inductees(type: str = None):
+def get_hall_of_fame_inductees(type: str = None, limit: Optional[int] = None, cursor: Optional[str] = None):
     """
-    Get all Hall of Fame inductees.
+    Get Hall of Fame inductees, most recent first.
 
     Query params:
         type: Filter by induction type (champion, fan_favorite, professors_choice)
+        limit: Page size (all inductees if omitted)
+        cursor: next_cursor from the previous page
     """
     hof = get_hall_of_fame()
     db = get_db()
 
-    inductees = hof.get_all_inductees(induction_type=type)
-
-    # Enrich with Pokémon data
-    enriched = []
-    for inductee in inductees:
-        pokemon = db.get_by_dex_number(inductee["pokemon_id"])
-        if pokemon:
-            enriched.append({
-                **inductee,
-                "pokemon": pokemon
-            })
+    if limit is not None and limit < 1:
+        raise HTTPException(status_code=400, detail="limit must be at least 1")
 
-    # Sort by induction date (most recent first)
-    enriched.sort(key=lambda x: x["induction_date"], reverse=True)
+    try:
+        inductees, next_cursor = hof.get_page(induction_type=type, limit=limit, cursor=cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    # Enrich with Pokémon data in one batch
+    pokemon = db.get_many(i["pokemon_id"] for i in inductees)
+    enriched = [
+        {**inductee, "pokemon": pokemon[inductee["pokemon_id"]]}
+        for inductee in inductees
+        if inductee["pokemon_id"] in pokemon
+    ]
 
-    return {"inductees": enriched, "total": len(enriched)}
+    return {
+        "inductees": enriched,
+        "total": hof.get_count(induction_type=type),
+        "next_cursor": next_cursor
+    }
 
 
 @app.get("/api/hall-of-fame/stats")
@@ -844,6 +1062,46 @@ def get_hall_of_fame_stats():
     return hof.get_stats()
 
 
+@app.get("/api/hall-of-fame/fan-favorite-candidates")
+def get_fan_favorite_candidates(min_votes: int = 50, min_tournaments: int = 2):
+    """
+    Get Pokémon eligible for Fan Favorite induction.
+
+    Criteria:
+    - Not already in Hall of Fame
+    - Never won a tournament championship
+    - Participated in multiple tournaments
+    - High total vote count across tournaments
+
+    Query params:
+        min_votes: Minimum total votes required (default: 50)
+        min_tournaments: Minimum tournaments participated (default: 2)
+    """
+    hof = get_hall_of_fame()
+    db = get_db()
+
+    # Already sorted by total votes (highest first)
+    stats = get_fan_favorites().get_candidates(
+        min_votes, min_tournaments, exclude=hof.is_inducted
+    )
+
+    pokemon = db.get_many(s["pokemon_id"] for s in stats)
+    candidates = [
+        {**s, "pokemon": pokemon[s["pokemon_id"]]}
+        for s in stats
+        if s["pokemon_id"] in pokemon
+    ]
+
+    return {
+        "candidates": candidates,
+        "total": len(candidates),
+        "criteria": {
+            "min_votes": min_votes,
+            "min_tournaments": min_tournaments
+        }
+    }
+
+
 @app.get("/api/hall-of-fame/{pokemon_id}")
 def get_hall_of_fame_inductee(pokemon_id: int):
     """Get Hall of Fame details for a specific Pokémon."""
@@ -893,6 +1151,51 @@ def induct_champion(req: InductChampionRequest):
     return result
 
 
+@app.post("/api/hall-of-fame/induct-fan-favorite")
+def induct_fan_favorite(req: InductFanFavoriteRequest):
+    """
+    Induct a Pokémon as Fan Favorite into the Hall of Fame.
+
+    This should be used for Pokémon that:
+    - Have high vote counts across multiple tournaments
+    - Never won a championship but are community favorites
+    """
+    hof = get_hall_of_fame()
+    db = get_db()
+
+    # Verify Pokémon exists
+    pokemon = db.get_by_dex_number(req.pokemon_id)
+    if not pokemon:
+        raise HTTPException(status_code=404, detail="Pokémon not found")
+
+    # Get tournament stats
+    stats = get_fan_favorites().get_stats(req.pokemon_id) or {
+        "total_votes": 0,
+        "tournaments_participated": 0,
+        "champion": False
+    }
+
+    # Verify they didn't win a championship
+    if stats["champion"]:
+        raise HTTPException(
+            status_code=400,
+            detail="Tournament champions cannot be inducted as Fan Favorites"
+        )
+
+    # Induct as Fan Favorite
+    result = hof.induct_fan_favorite(
+        pokemon_id=req.pokemon_id,
+        total_votes=stats["total_votes"],
+        tournaments_participated=stats["tournaments_participated"],
+        creator_quote=req.creator_quote
+    )
+
+    if not result["success"]:
+        raise HTTPException(status_code=400, detail=result["message"])
+
+    return result
+
+
 @app.post("/api/hall-of-fame/induct-professors-choice")
 def induct_professors_choice(req: InductProfessorsChoiceRequest):
     """Induct a Pokémon as Professor's Choice into the Hall of Fame."""
@@ -13,7 +13,7 @@ from dotenv import load_dotenv
 
 from src.image_generator import PokemonImageGenerator, structure_prompt
 from src.stats_generator import PokemonStatsGenerator
-from src.moves_generator import MoveGenerator
+from src.moves_generator import get_move_generator
 from src.pokedex_db import get_db
 
 load_dotenv()
@@ -31,7 +31,7 @@ class PokeDream:
         
         self.image_gen = PokemonImageGenerator(output_dir)
         self.stats_gen = PokemonStatsGenerator()
-        self.moves_gen = MoveGenerator()
+        self.moves_gen = get_move_generator()
         self.pokedex = get_db()
     
     def create(
@@ -0,0 +1,251 @@
+"""
+PokéDream Battle Engine
+Monte Carlo simulation of one-on-one battles between created Pokémon.
+
+Both sides fight at level 50 with their current moves. Each turn the faster
+Pokémon attacks first (speed ties are a coin flip), and each side uses the
+move with the highest expected damage against its opponent. Accuracy,
+critical hits and the 85-100% damage roll are drawn per simulation, and
+every turn is computed for all simulations at once with NumPy.
+
+Type effectiveness comes from the move database's coverage chart, which
+lists super-effective matchups only, so every other matchup is neutral.
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.moves_generator import get_move_generator
+
+
+LEVEL = 50
+MAX_TURNS = 100
+CRIT_CHANCE = 1 / 24
+CRIT_MULTIPLIER = 1.5
+STAB_MULTIPLIER = 1.5
+
+# Used when a Pokémon knows no damaging moves
+STRUGGLE = {
+    "name": "Struggle",
+    "type": None,
+    "category": "physical",
+    "power": 50,
+    "accuracy": 100,
+}
+
+
+class BattleEngine:
+    """Simulates battles from Pokédex entries and the move database."""
+    
+    def __init__(self, move_generator):
+        """
+        Args:
+            move_generator: MoveGenerator whose move database and coverage chart are used
+        """
+        self.types = list(move_generator.moves)
+        self.coverage_chart = {
+            attack_type: set(targets)
+            for attack_type, targets in move_generator.coverage_chart.items()
+        }
+        
+        # Damaging moves by name
+        self._moves = {}
+        for move_type, categories in move_generator.moves.items():
+            for category in ("physical", "special"):
+                for move in categories.get(category, []):
+                    if move.get("power"):
+                        self._moves[move["name"]] = {
+                            "name": move["name"],
+                            "type": move_type,
+                            "category": category,
+                            "power": move["power"],
+                            "accuracy": move.get("accuracy") or 100,
+                        }
+    
+    def effectiveness(self, move_type: Optional[str], defender_types: List[str]) -> float:
+        """Get the type multiplier of a move against a defender."""
+        targets = self.coverage_chart.get(move_type, ())
+        multiplier = 1.0
+        for defender_type in defender_types:
+            if defender_type in targets:
+                multiplier *= 2.0
+        return multiplier
+    
+    def combatant(self, pokemon: dict) -> Dict:
+        """
+        Build a Pokémon's level 50 battle profile.
+        
+        Stats assume perfect IVs and no EVs: HP is base + 75, the rest base + 20.
+        """
+        stats = pokemon["stats"]
+        moves = [
+            self._moves[name]
+            for name in pokemon.get("moveset", {}).get("current_moves", [])
+            if name in self._moves
+        ]
+        
+        return {
+            "dex_number": pokemon.get("dex_number"),
+            "name": pokemon.get("name"),
+            "types": [t.lower() for t in pokemon.get("types", []) if t],
+            "hp": stats["hp"] + 75,
+            "attack": stats["attack"] + 20,
+            "defense": stats["defense"] + 20,
+            "sp_attack": stats["sp_attack"] + 20,
+            "sp_defense": stats["sp_defense"] + 20,
+            "speed": stats["speed"] + 20,
+            "moves": moves or [STRUGGLE],
+        }
+    
+    def base_damage(self, attacker: Dict, defender: Dict, move: Dict) -> float:
+        """Damage of a hit before the random roll and critical hits."""
+        if move["category"] == "physical":
+            ratio = attacker["attack"] / defender["defense"]
+        else:
+            ratio = attacker["sp_attack"] / defender["sp_defense"]
+        
+        damage = (2 * LEVEL / 5 + 2) * move["power"] * ratio / 50 + 2
+        
+        if move["type"] in attacker["types"]:
+            damage *= STAB_MULTIPLIER
+        return damage * self.effectiveness(move["type"], defender["types"])
+    
+    def expected_damage(self, attacker: Dict, defender: Dict, move: Dict) -> float:
+        """Average damage per use, counting accuracy, rolls and critical hits."""
+        mean_roll = 0.925
+        mean_crit = 1 + CRIT_CHANCE * (CRIT_MULTIPLIER - 1)
+        accuracy = move["accuracy"] / 100
+        return self.base_damage(attacker, defender, move) * mean_roll * mean_crit * accuracy
+    
+    def best_move(self, attacker: Dict, defender: Dict) -> Dict:
+        """Get the attacker's highest expected-damage move against the defender."""
+        return max(attacker["moves"], key=lambda m: self.expected_damage(attacker, defender, m))
+    
+    def simulate(
+        self,
+        pokemon_a: dict,
+        pokemon_b: dict,
+        simulations: int = 2000,
+        seed: int = None
+    ) -> Dict:
+        """
+        Run Monte Carlo battles between two Pokémon.
+        
+        Args:
+            pokemon_a: Pokédex entry
+            pokemon_b: Pokédex entry
+            simulations: Number of battles
+            seed: Optional RNG seed for reproducible results
+        
+        Returns:
+            Win/draw probabilities, average battle length and the moves used
+        """
+        a = self.combatant(pokemon_a)
+        b = self.combatant(pokemon_b)
+        move_a = self.best_move(a, b)
+        move_b = self.best_move(b, a)
+        
+        a_won, b_won, turns = simulate_pairs(
+            np.random.default_rng(seed),
+            hp_a=np.array([a["hp"]]),
+            hp_b=np.array([b["hp"]]),
+            speed_a=np.array([a["speed"]]),
+            speed_b=np.array([b["speed"]]),
+            base_a=np.array([self.base_damage(a, b, move_a)]),
+            base_b=np.array([self.base_damage(b, a, move_b)]),
+            accuracy_a=np.array([move_a["accuracy"] / 100]),
+            accuracy_b=np.array([move_b["accuracy"] / 100]),
+            simulations=simulations,
+        )
+        
+        return {
+            "pokemon_a": {"dex_number": a["dex_number"], "name": a["name"], "move": move_a["name"]},
+            "pokemon_b": {"dex_number": b["dex_number"], "name": b["name"], "move": move_b["name"]},
+            "simulations": simulations,
+            "a_win_probability": float(a_won.mean()),
+            "b_win_probability": float(b_won.mean()),
+            "draw_probability": float(1 - a_won.mean() - b_won.mean()),
+            "average_turns": float(turns.mean()),
+        }
+
+
+def _rolls(rng: np.random.Generator, base: np.ndarray, accuracy: np.ndarray, shape: tuple) -> np.ndarray:
+    """Draw the damage of one attack per pair (rows) and simulation (columns)."""
+    hit = rng.random(shape) < accuracy[:, None]
+    roll = rng.uniform(0.85, 1.0, shape)
+    crit = np.where(rng.random(shape) < CRIT_CHANCE, CRIT_MULTIPLIER, 1.0)
+    return np.floor(base[:, None] * roll * crit) * hit
+
+
+def simulate_pairs(
+    rng: np.random.Generator,
+    hp_a: np.ndarray,
+    hp_b: np.ndarray,
+    speed_a: np.ndarray,
+    speed_b: np.ndarray,
+    base_a: np.ndarray,
+    base_b: np.ndarray,
+    accuracy_a: np.ndarray,
+    accuracy_b: np.ndarray,
+    simulations: int
+) -> tuple:
+    """
+    Run Monte Carlo battles for many pairs at once.
+    
+    Each argument has one entry per pair: level 50 HP and speed, the base
+    damage of the move each side uses, and its accuracy as a fraction.
+    
+    Returns:
+        (a_won, b_won, turns), each of shape (pairs, simulations)
+    """
+    shape = (len(hp_a), simulations)
+    hp_a = np.repeat(hp_a.astype(float)[:, None], simulations, axis=1)
+    hp_b = np.repeat(hp_b.astype(float)[:, None], simulations, axis=1)
+    active = np.ones(shape, dtype=bool)
+    a_won = np.zeros(shape, dtype=bool)
+    b_won = np.zeros(shape, dtype=bool)
+    turns = np.full(shape, MAX_TURNS)
+    
+    speed_tie = (speed_a == speed_b)[:, None]
+    faster = (speed_a > speed_b)[:, None]
+    
+    for turn in range(1, MAX_TURNS + 1):
+        # Speed ties are a coin flip each turn
+        coin = rng.random(shape) < 0.5 if speed_tie.any() else False
+        a_first = np.where(speed_tie, coin, faster)
+        
+        damage_a = _rolls(rng, base_a, accuracy_a, shape) * active
+        damage_b = _rolls(rng, base_b, accuracy_b, shape) * active
+        
+        # Faster side attacks, then the slower side if it's still standing
+        hp_b -= damage_a * a_first
+        hp_a -= damage_b * ~a_first
+        hp_a -= damage_b * (a_first & (hp_b > 0))
+        hp_b -= damage_a * (~a_first & (hp_a > 0))
+        
+        finished = active & ((hp_a <= 0) | (hp_b <= 0))
+        a_won |= finished & (hp_b <= 0)
+        b_won |= finished & (hp_a <= 0)
+        turns[finished] = turn
+        active &= ~finished
+        
+        if not active.any():
+            break
+    
+    return a_won, b_won, turns
+
+
+# Global instance
+_engine = None
+_engine_lock = threading.Lock()
+
+def get_battle_engine() -> BattleEngine:
+    """Get global battle engine instance."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = BattleEngine(get_move_generator())
+    return _engine
@@ -0,0 +1,160 @@
+"""
+PokéDream Bracket Engine
+Single-elimination brackets for any number of entrants.
+
+A bracket of size S (a power of two) is stored as an array tree of length
+2S, laid out like a binary heap: node 1 is the final, the children of node
+i are 2i and 2i + 1, and the entrant slots are nodes S..2S-1. Each node
+holds the dex number that won (or, for slots, entered) it. Matchup p of
+round r is node S / 2^r + p, so moving a winner up a round, or walking the
+path to the final, is a shift per matchup.
+
+Entrant counts that aren't a power of two are padded with byes. Each bye
+is paired with a real entrant in round 1, who advances straight to round 2.
+Byes sit in the slots of the bottom seeds of the standard layout (1 v S,
+2 v S-1, ...), so entrants who receive them can only meet late. Seeded
+brackets place entrants by that layout, so the top seeds get the byes.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+
+def bracket_size(entrants: int) -> int:
+    """Get the smallest power-of-two bracket that fits the entrants."""
+    if entrants < 2:
+        raise ValueError("A bracket needs at least 2 entrants")
+    return 1 << (entrants - 1).bit_length()
+
+
+def round_count(size: int) -> int:
+    """Get the number of rounds in a bracket of the given size."""
+    return size.bit_length() - 1
+
+
+def matchup_node(size: int, round_number: int, position: int) -> int:
+    """Get the tree node of a matchup."""
+    return (size >> round_number) + position
+
+
+def node_matchup(size: int, node: int) -> Tuple[int, int]:
+    """Get the (round_number, position) of a matchup node."""
+    depth = node.bit_length() - 1
+    return round_count(size) - depth, node - (1 << depth)
+
+
+def path_to_final(size: int, round_number: int, position: int) -> List[Tuple[int, int]]:
+    """Get the (round_number, position) matchups a winner would play through to the final."""
+    node = matchup_node(size, round_number, position)
+    path = []
+    while node >= 1:
+        path.append(node_matchup(size, node))
+        node >>= 1
+    return path
+
+
+def seed_positions(size: int) -> List[int]:
+    """Get the 1-based seed occupying each slot of a standard seeded bracket."""
+    order = [1]
+    while len(order) < size:
+        total = 2 * len(order) + 1
+        order = [seed for top in order for seed in (top, total - top)]
+    return order
+
+
+def _empty_matchup(matchup_id: str) -> Dict:
+    return {
+        "matchup_id": matchup_id,
+        "pokemon_a_id": None,
+        "pokemon_b_id": None,
+        "votes_a": 0,
+        "votes_b": 0,
+        "winner_id": None,
+        "status": "pending"
+    }
+
+
+def build_bracket(
+    tournament_id: str,
+    entrants: List[int],
+    seeded: bool = False
+) -> Tuple[Dict[str, List[Dict]], List[Optional[int]]]:
+    """
+    Build a bracket for the entrants.
+    
+    Args:
+        tournament_id: Prefix for matchup IDs
+        entrants: Dex numbers; paired in order around the bye slots
+        seeded: Treat entrants as ranked best first and place them by seed
+    
+    Returns:
+        (bracket, tree): round_N -> matchups, and the array tree
+    """
+    size = bracket_size(len(entrants))
+    rounds = round_count(size)
+    # Seeds past the entrant count are byes. Unseeded brackets use the same
+    # bye slots, so byes are spread across the bracket either way
+    positions = seed_positions(size)
+    if seeded:
+        slots = [
+            entrants[seed - 1] if seed <= len(entrants) else None
+            for seed in positions
+        ]
+    else:
+        remaining = iter(entrants)
+        slots = [next(remaining) if seed <= len(entrants) else None for seed in positions]
+    
+    tree = [None] * (2 * size)
+    tree[size:] = slots
+    
+    bracket = {}
+    for round_number in range(1, rounds + 1):
+        bracket[f"round_{round_number}"] = [
+            _empty_matchup(f"{tournament_id}_r{round_number}_m{position}")
+            for position in range(size >> round_number)
+        ]
+    
+    for position, matchup in enumerate(bracket["round_1"]):
+        matchup["pokemon_a_id"] = slots[2 * position]
+        matchup["pokemon_b_id"] = slots[2 * position + 1]
+        matchup["status"] = "active"
+        
+        if matchup["pokemon_b_id"] is None:
+            matchup["status"] = "bye"
+            advance_winner(bracket, tree, size, 1, position, matchup["pokemon_a_id"])
+    
+    return bracket, tree
+
+
+def advance_winner(
+    bracket: Dict[str, List[Dict]],
+    tree: List[Optional[int]],
+    size: int,
+    round_number: int,
+    position: int,
+    winner_id: int
+):
+    """Record a matchup's winner and seat them in the next round's matchup."""
+    node = matchup_node(size, round_number, position)
+    tree[node] = winner_id
+    bracket[f"round_{round_number}"][position]["winner_id"] = winner_id
+    
+    if node > 1:
+        parent = bracket[f"round_{round_number + 1}"][position >> 1]
+        side = "pokemon_b_id" if node & 1 else "pokemon_a_id"
+        parent[side] = winner_id
+
+
+def tree_from_bracket(bracket: Dict[str, List[Dict]]) -> Tuple[List[Optional[int]], int]:
+    """Rebuild the array tree of a bracket stored without one."""
+    size = 2 * len(bracket["round_1"])
+    tree = [None] * (2 * size)
+    
+    for round_key, matchups in bracket.items():
+        round_number = int(round_key.split("_")[1])
+        for position, matchup in enumerate(matchups):
+            tree[matchup_node(size, round_number, position)] = matchup["winner_id"]
+            if round_number == 1:
+                tree[size + 2 * position] = matchup["pokemon_a_id"]
+                tree[size + 2 * position + 1] = matchup["pokemon_b_id"]
+    
+    return tree, size
@@ -5,10 +5,13 @@ Generates rotating daily challenges to encourage diverse Pokemon creation.
 
 import json
 import hashlib
+import threading
 from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import Optional
 
+from src.json_store import SnapshotWriter
+
 
 # Challenge templates
 CHALLENGE_TEMPLATES = [
@@ -137,6 +140,9 @@ class DailyChallengeDB:
     def __init__(self, db_path: str = "data/daily_challenges.json"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(exist_ok=True)
+        self._lock = threading.RLock()
+        self._version = 0
+        self._writer = SnapshotWriter(self.db_path)
         self._load()
     
     def _load(self):
@@ -147,20 +153,34 @@ class DailyChallengeDB:
             self.data = {"completions": {}}
             self._save()
     
+    def _snapshot(self) -> tuple:
+        with self._lock:
+            self._version += 1
+            return self._version, json.dumps(self.data, indent=2)
+    
     def _save(self):
-        with open(self.db_path, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        version, text = self._snapshot()
+        self._writer.write(version, text)
     
-    def mark_completed(self, trainer_id: str, challenge_id: str, pokemon_id: str):
-        """Mark a challenge as completed by a trainer."""
-        if trainer_id not in self.data["completions"]:
-            self.data["completions"][trainer_id] = {}
+    def mark_completed(self, trainer_id: str, challenge_id: str, pokemon_id: str) -> bool:
+        """
+        Mark a challenge as completed by a trainer.
+        
+        Returns:
+            False if the trainer had already completed it
+        """
+        with self._lock:
+            completions = self.data["completions"].setdefault(trainer_id, {})
+            if challenge_id in completions:
+                return False
+            
+            completions[challenge_id] = {
+                "pokemon_id": pokemon_id,
+                "completed_at": datetime.now().isoformat()
+            }
         
-        self.data["completions"][trainer_id][challenge_id] = {
-            "pokemon_id": pokemon_id,
-            "completed_at": datetime.now().isoformat()
-        }
         self._save()
+        return True
     
     def has_completed(self, trainer_id: str, challenge_id: str) -> bool:
         """Check if trainer has completed a challenge."""
@@ -178,11 +198,14 @@ class DailyChallengeDB:
 
 # Global instance
 _challenge_db = None
+_challenge_db_lock = threading.Lock()
 
 def get_challenge_db() -> DailyChallengeDB:
     global _challenge_db
     if _challenge_db is None:
-        _challenge_db = DailyChallengeDB()
+        with _challenge_db_lock:
+            if _challenge_db is None:
+                _challenge_db = DailyChallengeDB()
     return _challenge_db
 
 
@@ -0,0 +1,271 @@
+"""
+PokéDream Damage Matrix
+Precomputed best-move expected damage between every pair of Pokémon.
+
+Entry [i, j] is the expected damage of attacker i's best move against
+defender j, as a fraction of j's HP, using the battle engine's level 50
+profiles and damage formula. The whole matrix is computed with NumPy
+broadcasting in blocks of attackers. Each new Pokémon appends one row and
+one column into spare capacity, so "who counters X" and "who does X
+threaten" are a partial sort of a single column or row.
+"""
+
+import threading
+from typing import Dict, List
+
+import numpy as np
+
+from src.battle_engine import (
+    BattleEngine,
+    CRIT_CHANCE,
+    CRIT_MULTIPLIER,
+    LEVEL,
+    STAB_MULTIPLIER,
+    get_battle_engine,
+)
+
+
+MAX_MOVES = 4
+BLOCK_SIZE = 256  # attackers per broadcast block
+MIN_CAPACITY = 64
+GROWTH = 1.25  # spare rows/columns kept for Pokémon created after a build
+MEAN_MODIFIER = 0.925 * (1 + CRIT_CHANCE * (CRIT_MULTIPLIER - 1))
+
+
+def best_move_damage(attackers: Dict[str, np.ndarray], defenders: Dict[str, np.ndarray]) -> tuple:
+    """
+    Pick each attacker's highest expected-damage move against each defender.
+    
+    Args:
+        attackers: Stacked battle profiles (see DamageMatrix)
+        defenders: Stacked battle profiles
+    
+    Returns:
+        (base, accuracy): attacker × defender arrays of the chosen move's
+        damage before the roll and critical hits, and its accuracy
+    """
+    physical = attackers["attack"][:, None] / defenders["defense"][None, :]
+    special = attackers["sp_attack"][:, None] / defenders["sp_defense"][None, :]
+    
+    # attacker × move × defender
+    ratio = np.where(attackers["special"][:, :, None], special[:, None, :], physical[:, None, :])
+    damage = (2 * LEVEL / 5 + 2) * attackers["power"][:, :, None] * ratio / 50 + 2
+    damage *= attackers["stab"][:, :, None]
+    damage *= defenders["taken"][:, attackers["move_type"]].transpose(1, 2, 0)
+    damage[attackers["power"] == 0] = 0
+    
+    best = (damage * attackers["accuracy"][:, :, None]).argmax(axis=1)
+    base = np.take_along_axis(damage, best[:, None, :], axis=1)[:, 0, :]
+    accuracy = np.take_along_axis(attackers["accuracy"], best, axis=1)
+    return base, accuracy
+
+
+class DamageMatrix:
+    """Dense attacker × defender expected damage table."""
+    
+    def __init__(self, engine: BattleEngine):
+        """
+        Args:
+            engine: Battle engine whose profiles, moves and coverage chart are used
+        """
+        self.engine = engine
+        self._type_index = {t: i for i, t in enumerate(engine.types)}
+        
+        # chart[m, t] is the multiplier of move type m against defender type t;
+        # the extra last row is for typeless moves (Struggle)
+        n_types = len(engine.types)
+        self._log_chart = np.zeros((n_types + 1, n_types))
+        for attack_type, targets in engine.coverage_chart.items():
+            for target in targets:
+                if attack_type in self._type_index and target in self._type_index:
+                    self._log_chart[self._type_index[attack_type], self._type_index[target]] = np.log(2.0)
+        
+        self._lock = threading.Lock()
+        self._dex = []
+        self._rows = {}
+        self._profiles = self._empty_profiles(0)
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+    
+    def _empty_profiles(self, n: int) -> Dict[str, np.ndarray]:
+        n_types = len(self.engine.types)
+        return {
+            "hp": np.zeros(n),
+            "attack": np.zeros(n),
+            "defense": np.zeros(n),
+            "sp_attack": np.zeros(n),
+            "sp_defense": np.zeros(n),
+            "speed": np.zeros(n),
+            "power": np.zeros((n, MAX_MOVES)),
+            "accuracy": np.zeros((n, MAX_MOVES)),
+            "special": np.zeros((n, MAX_MOVES), dtype=bool),
+            "stab": np.ones((n, MAX_MOVES)),
+            "move_type": np.full((n, MAX_MOVES), n_types),
+            # taken[i, m]: multiplier of move type m against Pokémon i
+            "taken": np.ones((n, n_types + 1)),
+        }
+    
+    def build_profiles(self, pokemon_list: List[dict]) -> Dict[str, np.ndarray]:
+        """Stack battle profiles into arrays."""
+        profiles = self._empty_profiles(len(pokemon_list))
+        types = np.zeros((len(pokemon_list), len(self.engine.types)))
+        
+        for i, pokemon in enumerate(pokemon_list):
+            c = self.engine.combatant(pokemon)
+            for stat in ("hp", "attack", "defense", "sp_attack", "sp_defense", "speed"):
+                profiles[stat][i] = c[stat]
+            for t in c["types"]:
+                if t in self._type_index:
+                    types[i, self._type_index[t]] = 1
+            
+            for k, move in enumerate(c["moves"][:MAX_MOVES]):
+                profiles["power"][i, k] = move["power"]
+                profiles["accuracy"][i, k] = move["accuracy"] / 100
+                profiles["special"][i, k] = move["category"] == "special"
+                if move["type"] in self._type_index:
+                    profiles["move_type"][i, k] = self._type_index[move["type"]]
+                if move["type"] in c["types"]:
+                    profiles["stab"][i, k] = STAB_MULTIPLIER
+        
+        # Dual types multiply, so sum logs over the defender's types
+        profiles["taken"] = np.exp(types @ self._log_chart.T)
+        return profiles
+    
+    @staticmethod
+    def _block(attackers: Dict[str, np.ndarray], defenders: Dict[str, np.ndarray]) -> np.ndarray:
+        """Best-move expected damage of each attacker against each defender, as a fraction of HP."""
+        base, accuracy = best_move_damage(attackers, defenders)
+        return base * accuracy * MEAN_MODIFIER / defenders["hp"][None, :]
+    
+    @staticmethod
+    def _slice(profiles: Dict[str, np.ndarray], start: int, stop: int) -> Dict[str, np.ndarray]:
+        return {key: values[start:stop] for key, values in profiles.items()}
+    
+    def build(self, pokemon_list: List[dict]):
+        """Compute the matrix for the whole Pokédex."""
+        profiles = self.build_profiles(pokemon_list)
+        n = len(pokemon_list)
+        capacity = self._capacity(n)
+        matrix = np.zeros((capacity, capacity), dtype=np.float32)
+        
+        for start in range(0, n, BLOCK_SIZE):
+            stop = min(start + BLOCK_SIZE, n)
+            matrix[start:stop, :n] = self._block(self._slice(profiles, start, stop), profiles)
+        
+        with self._lock:
+            self._dex = [p["dex_number"] for p in pokemon_list]
+            self._rows = {dex: i for i, dex in enumerate(self._dex)}
+            self._profiles = profiles
+            self._matrix = matrix
+    
+    @staticmethod
+    def _capacity(n: int) -> int:
+        """Rows and columns to allocate for n Pokémon plus room to grow."""
+        return max(MIN_CAPACITY, int(n * GROWTH) + 1)
+    
+    def add_pokemon(self, pokemon: dict):
+        """
+        Append a Pokémon's row and column. Subscribed to the Pokédex.
+        
+        Runs in the request that created the Pokémon, after it was saved,
+        so failures are logged rather than raised.
+        """
+        try:
+            self._append(pokemon)
+        except Exception as e:
+            print(f"⚠ Damage matrix update failed: {e}")
+    
+    def _append(self, pokemon: dict):
+        new = self.build_profiles([pokemon])
+        
+        with self._lock:
+            if pokemon["dex_number"] in self._rows:
+                return
+            
+            profiles = {
+                key: np.concatenate([values, new[key]])
+                for key, values in self._profiles.items()
+            }
+            n = len(self._dex)
+            
+            # Grow geometrically when full, so appends copy the matrix rarely
+            if n == len(self._matrix):
+                capacity = self._capacity(n)
+                matrix = np.zeros((capacity, capacity), dtype=np.float32)
+                matrix[:n, :n] = self._matrix
+                self._matrix = matrix
+            
+            self._matrix[n, :n + 1] = self._block(new, profiles)[0]
+            self._matrix[:n, n] = self._block(self._slice(profiles, 0, n), new)[:, 0]
+            
+            self._dex.append(pokemon["dex_number"])
+            self._rows[pokemon["dex_number"]] = n
+            self._profiles = profiles
+    
+    def _ranked(self, scores: np.ndarray, exclude: int, limit: int) -> List[int]:
+        """Row indices of the highest scores, best first."""
+        scores = scores.copy()
+        scores[exclude] = -np.inf
+        limit = min(limit, len(scores) - 1)
+        if limit <= 0:
+            return []
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        return sorted(top.tolist(), key=lambda i: (-scores[i], self._dex[i]))
+    
+    def get_counters(self, dex_number: int, limit: int = 10) -> List[Dict]:
+        """
+        Get the Pokémon that beat X hardest: most damage dealt to X minus damage taken from it.
+        
+        Returns:
+            Dicts with pokemon_id, damage_dealt and damage_taken (fractions of HP),
+            or an empty list if X isn't in the matrix
+        """
+        with self._lock:
+            row = self._rows.get(dex_number)
+            if row is None:
+                return []
+            n = len(self._dex)
+            dealt = self._matrix[:n, row]
+            taken = self._matrix[row, :n]
+            ranked = self._ranked(dealt - taken, row, limit)
+            
+            return [
+                {
+                    "pokemon_id": self._dex[i],
+                    "damage_dealt": round(float(dealt[i]), 3),
+                    "damage_taken": round(float(taken[i]), 3),
+                }
+                for i in ranked
+            ]
+    
+    def get_threatened(self, dex_number: int, limit: int = 10) -> List[Dict]:
+        """
+        Get the Pokémon X hits hardest.
+        
+        Returns:
+            Dicts with pokemon_id and damage (a fraction of that Pokémon's HP),
+            or an empty list if X isn't in the matrix
+        """
+        with self._lock:
+            row = self._rows.get(dex_number)
+            if row is None:
+                return []
+            damage = self._matrix[row, :len(self._dex)]
+            
+            return [
+                {"pokemon_id": self._dex[i], "damage": round(float(damage[i]), 3)}
+                for i in self._ranked(damage, row, limit)
+            ]
+
+
+# Global instance
+_matrix = None
+_matrix_lock = threading.Lock()
+
+def get_damage_matrix() -> DamageMatrix:
+    """Get global damage matrix instance."""
+    global _matrix
+    if _matrix is None:
+        with _matrix_lock:
+            if _matrix is None:
+                _matrix = DamageMatrix(get_battle_engine())
+    return _matrix
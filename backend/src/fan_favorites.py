@@ -0,0 +1,138 @@
+"""
+PokéDream Fan Favorites
+Materialized per-Pokémon tournament aggregates for Fan Favorite candidates.
+
+Participation counts and champion flags are updated as tournaments are
+created and completed, and vote totals as votes land. Non-champions are
+kept in a table sorted by votes, with each vote moving one entry by
+bisection, so any min_votes / min_tournaments filter is a short scan.
+"""
+
+import bisect
+import threading
+from typing import Dict, List, Optional
+
+
+class FanFavoriteView:
+    """Per-Pokémon participation and vote aggregate."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._table = []  # (-total_votes, pokemon_id) for every non-champion
+    
+    @staticmethod
+    def _table_key(stats: Dict) -> tuple:
+        """Sort key in the candidate table: most votes first, then by dex number."""
+        return (-stats["total_votes"], stats["pokemon_id"])
+    
+    def _table_remove(self, stats: Dict):
+        del self._table[bisect.bisect_left(self._table, self._table_key(stats))]
+    
+    def _entry(self, pokemon_id: int) -> Dict:
+        """Get (or create) a Pokémon's aggregate. Called with the lock held."""
+        stats = self._stats.get(pokemon_id)
+        if stats is None:
+            stats = {
+                "pokemon_id": pokemon_id,
+                "total_votes": 0,
+                "tournaments_participated": 0,
+                "champion": False
+            }
+            self._stats[pokemon_id] = stats
+            bisect.insort(self._table, self._table_key(stats))
+        return stats
+    
+    def rebuild(self, tournament_system, voting_system):
+        """Rebuild the aggregate from every tournament and the vote counters."""
+        summaries = tournament_system.get_tournament_history(
+            limit=tournament_system.get_tournament_count()
+        )
+        
+        with self._lock:
+            self._stats = {}
+            self._table = []
+            
+            for summary in summaries:
+                for pokemon_id in summary["participants"]:
+                    self._entry(pokemon_id)["tournaments_participated"] += 1
+                if summary["champion_id"] is not None:
+                    self._entry(summary["champion_id"])["champion"] = True
+            
+            for pokemon_id, stats in self._stats.items():
+                stats["total_votes"] = voting_system.get_pokemon_total_votes(pokemon_id)
+            
+            self._table = sorted(
+                self._table_key(s) for s in self._stats.values() if not s["champion"]
+            )
+    
+    def record_vote(self, matchup_id: str, pokemon_id: int):
+        """Count a vote. Subscribed to the voting system."""
+        with self._lock:
+            stats = self._entry(pokemon_id)
+            if stats["champion"]:
+                stats["total_votes"] += 1
+                return
+            
+            self._table_remove(stats)
+            stats["total_votes"] += 1
+            bisect.insort(self._table, self._table_key(stats))
+    
+    def record_tournament(self, event: str, tournament: Dict):
+        """Count participation and champions. Subscribed to the tournament system."""
+        with self._lock:
+            if event == "created":
+                for pokemon_id in tournament["participants"]:
+                    self._entry(pokemon_id)["tournaments_participated"] += 1
+            elif event == "completed":
+                stats = self._entry(tournament["champion_id"])
+                if not stats["champion"]:
+                    self._table_remove(stats)
+                    stats["champion"] = True
+    
+    def get_stats(self, pokemon_id: int) -> Optional[Dict]:
+        """Get a Pokémon's aggregate, or None if it never entered a tournament."""
+        with self._lock:
+            stats = self._stats.get(pokemon_id)
+            return dict(stats) if stats else None
+    
+    def get_candidates(self, min_votes: int, min_tournaments: int, exclude=None) -> List[Dict]:
+        """
+        Get non-champions meeting the thresholds, highest total votes first.
+        
+        Args:
+            min_votes: Minimum total votes
+            min_tournaments: Minimum tournaments participated
+            exclude: Optional predicate on pokemon_id (e.g. already inducted)
+        """
+        with self._lock:
+            eligible = []
+            for negative_votes, pokemon_id in self._table:
+                if -negative_votes < min_votes:
+                    break
+                stats = self._stats[pokemon_id]
+                if stats["tournaments_participated"] < min_tournaments:
+                    continue
+                eligible.append({
+                    "pokemon_id": pokemon_id,
+                    "total_votes": stats["total_votes"],
+                    "tournaments_participated": stats["tournaments_participated"]
+                })
+        
+        if exclude:
+            return [stats for stats in eligible if not exclude(stats["pokemon_id"])]
+        return eligible
+
+
+# Global instance
+_fan_favorites = None
+_fan_favorites_lock = threading.Lock()
+
+def get_fan_favorites() -> FanFavoriteView:
+    """Get global fan favorite view instance."""
+    global _fan_favorites
+    if _fan_favorites is None:
+        with _fan_favorites_lock:
+            if _fan_favorites is None:
+                _fan_favorites = FanFavoriteView()
+    return _fan_favorites
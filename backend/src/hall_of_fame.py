@@ -3,17 +3,25 @@ Hall of Fame System
 Tracks legendary Pokémon across different categories.
 """
 
+import bisect
 import json
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Tuple
+
+from src.json_store import SnapshotWriter
 
 
 class HallOfFame:
     def __init__(self, data_file: str = "data/hall_of_fame.json"):
         self.data_file = Path(data_file)
         self.data_file.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._version = 0
+        self._writer = SnapshotWriter(self.data_file)
         self.inductees = self._load()
+        self._build_index()
     
     def _load(self) -> list:
         """Load Hall of Fame data from JSON file."""
@@ -22,18 +30,70 @@ class HallOfFame:
                 return json.load(f)
         return []
     
+    def _build_index(self):
+        """
+        Index inductees by Pokémon and by induction type.
+        
+        Each type keeps its inductees in induction-date order alongside a
+        parallel list of (induction_date, pokemon_id) keys for cursor paging.
+        The None key holds every inductee.
+        """
+        self._by_pokemon = {}
+        self._ordered = {None: []}
+        self._keys = {None: []}
+        self._type_counts = {}
+        
+        for inductee in sorted(self.inductees, key=self._sort_key):
+            self._index(inductee)
+    
+    @staticmethod
+    def _sort_key(inductee: dict) -> Tuple[str, int]:
+        return inductee["induction_date"], inductee["pokemon_id"]
+    
+    def _index(self, inductee: dict):
+        """Add an inductee to the indexes."""
+        self._by_pokemon[inductee["pokemon_id"]] = inductee
+        
+        induction_type = inductee["induction_type"]
+        self._type_counts[induction_type] = self._type_counts.get(induction_type, 0) + 1
+        
+        key = self._sort_key(inductee)
+        for group in (None, induction_type):
+            ordered = self._ordered.setdefault(group, [])
+            keys = self._keys.setdefault(group, [])
+            i = bisect.bisect_right(keys, key)
+            keys.insert(i, key)
+            ordered.insert(i, inductee)
+    
+    def _induct(self, inductee: dict) -> bool:
+        """Add an inductee unless the Pokémon is already in the Hall of Fame."""
+        with self._lock:
+            if inductee["pokemon_id"] in self._by_pokemon:
+                return False
+            self.inductees.append(inductee)
+            self._index(inductee)
+        
+        self._save()
+        return True
+    
+    def _snapshot(self) -> tuple:
+        """Serialize the inductee list under the store lock."""
+        with self._lock:
+            self._version += 1
+            return self._version, json.dumps(self.inductees, indent=2, ensure_ascii=False)
+    
     def _save(self):
         """Save Hall of Fame data to JSON file."""
-        with open(self.data_file, 'w', encoding='utf-8') as f:
-            json.dump(self.inductees, f, indent=2, ensure_ascii=False)
+        version, text = self._snapshot()
+        self._writer.write(version, text)
     
     def is_inducted(self, pokemon_id: int) -> bool:
         """Check if a Pokémon is already in the Hall of Fame."""
-        return any(i["pokemon_id"] == pokemon_id for i in self.inductees)
+        return pokemon_id in self._by_pokemon
     
     def get_inductee(self, pokemon_id: int) -> Optional[dict]:
         """Get Hall of Fame entry for a specific Pokémon."""
-        return next((i for i in self.inductees if i["pokemon_id"] == pokemon_id), None)
+        return self._by_pokemon.get(pokemon_id)
     
     def get_all_inductees(self, induction_type: str = None) -> list:
         """
@@ -43,9 +103,55 @@ class HallOfFame:
             induction_type: Filter by type (champion, fan_favorite, professors_choice)
         """
         if induction_type:
-            return [i for i in self.inductees if i["induction_type"] == induction_type]
+            return list(self._ordered.get(induction_type, []))
         return self.inductees.copy()
     
+    def get_count(self, induction_type: str = None) -> int:
+        """Get the number of inductees, optionally of one type."""
+        return len(self._ordered.get(induction_type, []))
+    
+    def get_page(
+        self,
+        induction_type: str = None,
+        limit: int = None,
+        cursor: str = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        """
+        Get inductees newest first, one page at a time.
+        
+        Args:
+            induction_type: Filter by type (champion, fan_favorite, professors_choice)
+            limit: Page size (all remaining inductees if None)
+            cursor: next_cursor from the previous page, or None for the first page
+        
+        Returns:
+            (inductees, next_cursor); next_cursor is None on the last page
+        
+        Raises:
+            ValueError: If limit is below 1 or the cursor is malformed
+        """
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be at least 1")
+        
+        with self._lock:
+            ordered = self._ordered.get(induction_type, [])
+            keys = self._keys.get(induction_type, [])
+            
+            end = len(ordered)
+            if cursor:
+                induction_date, _, pokemon_id = cursor.rpartition("|")
+                end = bisect.bisect_left(keys, (induction_date, int(pokemon_id)))
+            
+            start = 0 if limit is None else max(end - limit, 0)
+            page = ordered[start:end][::-1]
+        
+        next_cursor = None
+        if start > 0:
+            induction_date, pokemon_id = self._sort_key(ordered[start])
+            next_cursor = f"{induction_date}|{pokemon_id}"
+        
+        return page, next_cursor
+    
     def induct_champion(
         self,
         pokemon_id: int,
@@ -62,9 +168,6 @@ class HallOfFame:
             total_votes: Total votes received in the tournament
             creator_quote: Optional quote from the creator
         """
-        if self.is_inducted(pokemon_id):
-            return {"success": False, "message": "Pokémon already in Hall of Fame"}
-        
         inductee = {
             "pokemon_id": pokemon_id,
             "induction_type": "champion",
@@ -74,8 +177,8 @@ class HallOfFame:
             "creator_quote": creator_quote
         }
         
-        self.inductees.append(inductee)
-        self._save()
+        if not self._induct(inductee):
+            return {"success": False, "message": "Pokémon already in Hall of Fame"}
         
         return {"success": True, "message": "Champion inducted into Hall of Fame!", "inductee": inductee}
     
@@ -95,9 +198,6 @@ class HallOfFame:
             tournaments_participated: Number of tournaments participated in
             creator_quote: Optional quote from the creator
         """
-        if self.is_inducted(pokemon_id):
-            return {"success": False, "message": "Pokémon already in Hall of Fame"}
-        
         inductee = {
             "pokemon_id": pokemon_id,
             "induction_type": "fan_favorite",
@@ -107,8 +207,8 @@ class HallOfFame:
             "creator_quote": creator_quote
         }
         
-        self.inductees.append(inductee)
-        self._save()
+        if not self._induct(inductee):
+            return {"success": False, "message": "Pokémon already in Hall of Fame"}
         
         return {"success": True, "message": "Fan Favorite inducted into Hall of Fame!", "inductee": inductee}
     
@@ -126,9 +226,6 @@ class HallOfFame:
             reason: Reason for the Professor's Choice selection
             creator_quote: Optional quote from the creator
         """
-        if self.is_inducted(pokemon_id):
-            return {"success": False, "message": "Pokémon already in Hall of Fame"}
-        
         inductee = {
             "pokemon_id": pokemon_id,
             "induction_type": "professors_choice",
@@ -137,32 +234,33 @@ class HallOfFame:
             "creator_quote": creator_quote
         }
         
-        self.inductees.append(inductee)
-        self._save()
+        if not self._induct(inductee):
+            return {"success": False, "message": "Pokémon already in Hall of Fame"}
         
         return {"success": True, "message": "Professor's Choice inducted into Hall of Fame!", "inductee": inductee}
     
     def get_stats(self) -> dict:
         """Get Hall of Fame statistics."""
-        champions = len([i for i in self.inductees if i["induction_type"] == "champion"])
-        fan_favorites = len([i for i in self.inductees if i["induction_type"] == "fan_favorite"])
-        professors_choices = len([i for i in self.inductees if i["induction_type"] == "professors_choice"])
+        counts = self._type_counts
         
         return {
             "total_inductees": len(self.inductees),
-            "champions": champions,
-            "fan_favorites": fan_favorites,
-            "professors_choices": professors_choices
+            "champions": counts.get("champion", 0),
+            "fan_favorites": counts.get("fan_favorite", 0),
+            "professors_choices": counts.get("professors_choice", 0)
         }
 
 
 # Singleton instance
 _hall_of_fame = None
+_hall_of_fame_lock = threading.Lock()
 
 
 def get_hall_of_fame() -> HallOfFame:
     """Get the global Hall of Fame instance."""
     global _hall_of_fame
     if _hall_of_fame is None:
-        _hall_of_fame = HallOfFame()
+        with _hall_of_fame_lock:
+            if _hall_of_fame is None:
+                _hall_of_fame = HallOfFame()
     return _hall_of_fame
\ No newline at end of file
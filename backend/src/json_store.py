@@ -0,0 +1,38 @@
+"""
+PokéDream JSON Storage
+Atomic, ordered snapshot writes for the JSON-backed stores.
+"""
+
+import os
+import threading
+from pathlib import Path
+
+
+class SnapshotWriter:
+    """
+    Writes serialized snapshots of a store to disk.
+    
+    Stores serialize their data while holding their own lock, then hand the
+    text here to be written outside it. Each snapshot carries a version; a
+    write is skipped if a newer snapshot already landed, so a slow thread can
+    never replace newer data with older data. Files are written to a temp
+    file and swapped in with os.replace, so readers never see a torn file.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._written_version = 0
+    
+    def write(self, version: int, text: str):
+        """Write a snapshot unless a newer one has already been written."""
+        with self._lock:
+            if version <= self._written_version:
+                return
+            
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, self.path)
+            
+            self._written_version = version
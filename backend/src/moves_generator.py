@@ -1,16 +1,38 @@
 """
 PokéDream Move Generator
 Assigns moves based on type, stats, and tier using a real move database.
+
+The database is indexed once at load: a move-name index for type and
+category lookups, and move pools per (type, category, tier) that
+level-up, TM and egg moves are drawn from. One loaded generator is shared
+per process through get_move_generator().
+
+TM coverage is planned with the coverage chart encoded as bitmasks, one
+bit per type. For every type combination the best set of coverage types
+is found by exhaustive search at load, so movesets read it from a table.
 """
 
 import json
 import random
+import threading
+from itertools import combinations
 from pathlib import Path
 
 
 class MoveGenerator:
     """Generate movesets for Pokemon based on type, stats, and tier."""
     
+    TIER_LEVELS = {
+        "early_game": [1, 5, 9, 13, 17, 21, 25],
+        "mid_game": [1, 5, 10, 15, 20, 25, 30, 35, 40],
+        "fully_evolved": [1, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50],
+        "pseudo_legendary": [1, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55, 60],
+        "legendary": [1, 5, 10, 15, 20, 30, 40, 50, 60, 70, 80]
+    }
+    
+    EGG_MOVE_TAGS = {"priority", "drain", "high_crit", "recoil"}
+    MAX_COVERAGE_TYPES = 3
+    
     def __init__(self, database_path: str = "data/moves_database.json"):
         db_path = Path(database_path)
         if not db_path.exists():
@@ -21,6 +43,113 @@ class MoveGenerator:
         
         self.moves = data["moves"]
         self.coverage_chart = data["coverage_chart"]
+        self._build_index()
+    
+    def _build_index(self):
+        """Index moves by name and group them into pools."""
+        self._move_index = {}     # name -> (type, category), first listing wins
+        self._tier_pools = {}     # (type, category, tier) -> moves
+        self._all_moves = {}      # type -> moves of every category
+        self._tm_pools = {}       # (type, category) -> mid and late tier moves
+        self._egg_pools = {}      # type -> moves with egg move tags
+        
+        for move_type, categories in self.moves.items():
+            self._all_moves[move_type] = []
+            self._egg_pools[move_type] = []
+            
+            for category in ["physical", "special", "status"]:
+                for move in categories.get(category, []):
+                    self._move_index.setdefault(move["name"], (move_type, category))
+                    self._tier_pools.setdefault((move_type, category, move.get("tier")), []).append(move)
+                    self._all_moves[move_type].append(move)
+                    
+                    if move.get("tier") in ("mid", "late"):
+                        self._tm_pools.setdefault((move_type, category), []).append(move)
+                    if self.EGG_MOVE_TAGS.intersection(move.get("tags", [])):
+                        self._egg_pools[move_type].append(move)
+        
+        # (types, attack_category) -> early, mid and late level-up pools
+        self._level_up_pools = {}
+        
+        self._build_coverage_table()
+    
+    def _type_mask(self, types) -> int:
+        """Encode types as a bitmask."""
+        mask = 0
+        for t in types:
+            mask |= self._type_bits.get(t, 0)
+        return mask
+    
+    def _build_coverage_table(self):
+        """
+        Plan TM coverage types for every single and dual type combination.
+        
+        A Pokémon's weaknesses are the attacking types super effective
+        against it, less any its STAB moves already hit super effectively.
+        The coverage chart only lists super-effective matchups, so for dual
+        types a resistance is approximated from the chart in reverse: a type
+        resists the attacking types it is super effective against (other
+        than its own). An attacking type is a weakness when it hits more of
+        the Pokémon's types super effectively than resist it, so Electric
+        is not a Water/Ground weakness.
+        
+        For each attack category, every set of up to MAX_COVERAGE_TYPES move
+        types with TMs (other than the Pokémon's own) is scored by weaknesses
+        covered, then the most types hit super effectively overall (STAB
+        included), then fewest types.
+        """
+        type_names = list(self.moves)
+        self._type_bits = {t: 1 << i for i, t in enumerate(type_names)}
+        
+        # reach[t]: types that t's moves are super effective against
+        reach = {t: self._type_mask(self.coverage_chart.get(t, [])) for t in type_names}
+        
+        # resisted_by[t]: types approximated as resisting t (see above)
+        resisted_by = {
+            t: self._type_mask(d for d in type_names if d != t and t in self.coverage_chart.get(d, []))
+            for t in type_names
+        }
+        
+        candidate_sets = {}
+        for category in ("physical", "special"):
+            usable = [t for t in type_names if self._tm_pools.get((t, category))]
+            candidate_sets[category] = [
+                (combo, self._type_mask(combo), self._type_mask(t for c in combo for t in self.coverage_chart.get(c, [])))
+                for size in range(self.MAX_COVERAGE_TYPES + 1)
+                for combo in combinations(usable, size)
+            ]
+        
+        combos = [(t,) for t in type_names] + list(combinations(type_names, 2))
+        self._coverage_table = {}
+        
+        for combo in combos:
+            own = self._type_mask(combo)
+            stab_reach = self._type_mask(x for t in combo for x in self.coverage_chart.get(t, []))
+            weaknesses = self._type_mask(
+                t for t in type_names
+                if (reach[t] & own).bit_count() > (resisted_by[t] & own).bit_count()
+            )
+            uncovered = weaknesses & ~stab_reach
+            
+            for category, candidates in candidate_sets.items():
+                best = None
+                best_score = None
+                for types, mask, hits in candidates:
+                    if mask & own:
+                        continue
+                    score = (
+                        (hits & uncovered).bit_count(),
+                        (hits | stab_reach).bit_count(),
+                        -len(types)
+                    )
+                    if best_score is None or score > best_score:
+                        best, best_score = types, score
+                
+                self._coverage_table[(own, category)] = list(best)
+    
+    def get_coverage_types(self, types, attack_category: str) -> list:
+        """Get the planned TM coverage types for a type combination."""
+        return list(self._coverage_table.get((self._type_mask(types), attack_category), []))
     
     def generate_moveset(self, pokemon: dict) -> dict:
         """
@@ -32,13 +161,7 @@ class MoveGenerator:
         Returns:
             Dictionary with level_up_moves, tm_moves, egg_moves, current_moves
         """
-        types = [t.lower() for t in pokemon["types"] if t]
-        stats = pokemon["stats"]
-        tier = pokemon.get("tier", "fully_evolved")
-        
-        # Determine if physical or special attacker
-        is_physical = stats["attack"] >= stats["sp_attack"]
-        attack_category = "physical" if is_physical else "special"
+        types, attack_category, tier = self._moveset_key(pokemon)
         
         # Generate different move lists
         level_up_moves = self._generate_level_up_moves(types, attack_category, tier)
@@ -53,6 +176,54 @@ class MoveGenerator:
             "current_moves": current_moves
         }
     
+    def generate_movesets(self, pokemon_list: list, seed: int = None) -> list:
+        """
+        Generate movesets for many Pokemon in one call.
+        
+        Pokemon sharing types, attack category and tier are generated
+        together, so each group looks up its pools and egg moves once.
+        
+        Args:
+            pokemon_list: Pokemon data dicts with types, stats, tier
+            seed: RNG seed; the same list and seed give the same movesets
+        
+        Returns:
+            Movesets in the order of pokemon_list
+        """
+        rng = random.Random(seed)
+        
+        groups = {}
+        for i, pokemon in enumerate(pokemon_list):
+            groups.setdefault(self._moveset_key(pokemon), []).append(i)
+        
+        movesets = [None] * len(pokemon_list)
+        for (types, attack_category, tier), indices in groups.items():
+            egg_moves = self._generate_egg_moves(types, attack_category)
+            
+            for i in indices:
+                level_up_moves = self._generate_level_up_moves(types, attack_category, tier, rng)
+                movesets[i] = {
+                    "level_up_moves": level_up_moves,
+                    "tm_moves": self._generate_tm_moves(types, attack_category, rng),
+                    "egg_moves": [dict(m) for m in egg_moves],
+                    "current_moves": self._select_current_moves(level_up_moves, tier)
+                }
+        
+        return movesets
+    
+    @staticmethod
+    def _moveset_key(pokemon: dict) -> tuple:
+        """Get the (types, attack_category, tier) a moveset depends on."""
+        types = tuple(t.lower() for t in pokemon["types"] if t)
+        stats = pokemon["stats"]
+        tier = pokemon.get("tier", "fully_evolved")
+        
+        # Determine if physical or special attacker
+        is_physical = stats["attack"] >= stats["sp_attack"]
+        attack_category = "physical" if is_physical else "special"
+        
+        return types, attack_category, tier
+    
     def _get_moves_by_type(self, move_type: str, category: str = None) -> list:
         """Get all moves of a specific type, optionally filtered by category."""
         if move_type not in self.moves:
@@ -64,89 +235,109 @@ class MoveGenerator:
             return type_moves[category]
         
         # Return all categories
-        all_moves = []
-        for cat in ["physical", "special", "status"]:
-            if cat in type_moves:
-                all_moves.extend(type_moves[cat])
-        return all_moves
+        return self._all_moves[move_type]
+    
+    def _get_level_up_pools(self, types: list, attack_category: str) -> tuple:
+        """
+        Get the early, mid and late level-up pools for a type combination.
+        
+        Each pool holds (name, type, power, category) entries, with each move
+        at most once across the three. Pools are built on first use and cached.
+        """
+        key = (tuple(types), attack_category)
+        pools = self._level_up_pools.get(key)
+        if pools is not None:
+            return pools
+        
+        def pool(tier: str, normal_status: bool) -> list:
+            sources = []
+            for t in types:
+                sources.append((t, attack_category))
+                sources.append((t, "status"))
+            sources.append(("normal", attack_category))
+            if normal_status:
+                sources.append(("normal", "status"))
+            
+            return [
+                (move["name"], *self._move_index[move["name"]], move.get("power"))
+                for move_type, category in sources
+                for move in self._tier_pools.get((move_type, category, tier), [])
+            ]
+        
+        # Normal status moves only come early
+        seen = set()
+        pools = []
+        for entries in (pool("early", True), pool("mid", False), pool("late", False)):
+            unique = []
+            for name, move_type, category, power in entries:
+                if name not in seen:
+                    seen.add(name)
+                    unique.append((name, move_type, power, category))
+            pools.append(unique)
+        
+        pools = tuple(pools)
+        self._level_up_pools[key] = pools
+        return pools
     
-    def _generate_level_up_moves(self, types: list, attack_category: str, tier: str) -> list:
+    def _generate_level_up_moves(
+        self,
+        types: tuple,
+        attack_category: str,
+        tier: str,
+        rng: random.Random = None
+    ) -> list:
         """Generate level-up move progression."""
+        rng = rng or random
         level_moves = []
+        levels = self.TIER_LEVELS.get(tier, self.TIER_LEVELS["fully_evolved"])
         
-        # Determine tier progression
-        tier_levels = {
-            "early_game": [1, 5, 9, 13, 17, 21, 25],
-            "mid_game": [1, 5, 10, 15, 20, 25, 30, 35, 40],
-            "fully_evolved": [1, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50],
-            "pseudo_legendary": [1, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55, 60],
-            "legendary": [1, 5, 10, 15, 20, 30, 40, 50, 60, 70, 80]
-        }
-        
-        levels = tier_levels.get(tier, tier_levels["fully_evolved"])
-        
-        # Collect available moves
-        stab_moves = []
-        for t in types:
-            stab_moves.extend(self._get_moves_by_type(t, attack_category))
-            stab_moves.extend(self._get_moves_by_type(t, "status"))
-        
-        # Add Normal-type moves for variety
-        normal_moves = self._get_moves_by_type("normal", attack_category)
-        normal_status = self._get_moves_by_type("normal", "status")
-        
-        # Sort by tier
-        early_moves = [m for m in stab_moves + normal_moves + normal_status if m.get("tier") == "early"]
-        mid_moves = [m for m in stab_moves + normal_moves if m.get("tier") == "mid"]
-        late_moves = [m for m in stab_moves + normal_moves if m.get("tier") == "late"]
-        
-        used_moves = set()
+        # Copies of the cached pools; drawn moves are swap-removed
+        early, mid, late = (list(p) for p in self._get_level_up_pools(types, attack_category))
         
         for i, level in enumerate(levels):
             # Progress from early to late moves
             if i < len(levels) // 3:
-                pool = early_moves
+                phase = (early,)
             elif i < 2 * len(levels) // 3:
-                pool = early_moves + mid_moves
+                phase = (early, mid)
             else:
-                pool = mid_moves + late_moves
+                phase = (mid, late)
             
-            # Filter out already used moves
-            available = [m for m in pool if m["name"] not in used_moves]
+            total = sum(len(p) for p in phase)
+            if not total:
+                continue
             
-            if available:
-                move = random.choice(available)
-                used_moves.add(move["name"])
-                level_moves.append({
-                    "level": level,
-                    "move": move["name"],
-                    "type": self._find_move_type(move["name"]),
-                    "power": move.get("power"),
-                    "category": self._find_move_category(move["name"])
-                })
+            # Uniform draw across the phase's pools without replacement
+            k = rng.randrange(total)
+            for pool in phase:
+                if k < len(pool):
+                    break
+                k -= len(pool)
+            pool[k], pool[-1] = pool[-1], pool[k]
+            name, move_type, power, category = pool.pop()
+            
+            level_moves.append({
+                "level": level,
+                "move": name,
+                "type": move_type,
+                "power": power,
+                "category": category
+            })
         
         return level_moves
     
-    def _generate_tm_moves(self, types: list, attack_category: str) -> list:
+    def _generate_tm_moves(self, types: tuple, attack_category: str, rng: random.Random = None) -> list:
         """Generate TM-compatible moves (coverage + utility)."""
+        rng = rng or random
         tm_moves = []
         used_moves = set()
         
-        # Get coverage moves based on type chart
-        coverage_types = set()
-        for t in types:
-            if t in self.coverage_chart:
-                # Types that the Pokemon's types are super effective against
-                pass
-            # Find types that cover the Pokemon's weaknesses
-            for other_type, effective_against in self.coverage_chart.items():
-                if other_type not in types and len(coverage_types) < 4:
-                    coverage_types.add(other_type)
+        # Types whose moves hit the Pokemon's weaknesses super effectively
+        coverage_types = self.get_coverage_types(types, attack_category)
         
         # Add STAB TM moves
         for t in types:
-            type_moves = self._get_moves_by_type(t, attack_category)
-            late_moves = [m for m in type_moves if m.get("tier") in ["mid", "late"]]
+            late_moves = self._tm_pools.get((t, attack_category), [])
             for move in late_moves[:2]:
                 if move["name"] not in used_moves:
                     used_moves.add(move["name"])
@@ -158,11 +349,10 @@ class MoveGenerator:
                     })
         
         # Add coverage moves
-        for cov_type in list(coverage_types)[:3]:
-            type_moves = self._get_moves_by_type(cov_type, attack_category)
-            good_moves = [m for m in type_moves if m.get("tier") in ["mid", "late"]]
+        for cov_type in coverage_types[:3]:
+            good_moves = self._tm_pools.get((cov_type, attack_category))
             if good_moves:
-                move = random.choice(good_moves)
+                move = rng.choice(good_moves)
                 if move["name"] not in used_moves:
                     used_moves.add(move["name"])
                     tm_moves.append({
@@ -190,23 +380,19 @@ class MoveGenerator:
         
         return tm_moves[:8]  # Limit to 8 TMs
     
-    def _generate_egg_moves(self, types: list, attack_category: str) -> list:
+    def _generate_egg_moves(self, types: tuple, attack_category: str) -> list:
         """Generate egg moves (special/rare moves)."""
         egg_moves = []
         
-        # Look for moves with special tags
-        special_tags = ["priority", "drain", "high_crit", "recoil"]
-        
         for t in types:
-            all_type_moves = self._get_moves_by_type(t)
-            for move in all_type_moves:
-                if any(tag in move.get("tags", []) for tag in special_tags):
-                    if len(egg_moves) < 4:
-                        egg_moves.append({
-                            "move": move["name"],
-                            "type": t,
-                            "power": move.get("power")
-                        })
+            for move in self._egg_pools.get(t, []):
+                if len(egg_moves) >= 4:
+                    return egg_moves
+                egg_moves.append({
+                    "move": move["name"],
+                    "type": t,
+                    "power": move.get("power")
+                })
         
         return egg_moves
     
@@ -233,21 +419,13 @@ class MoveGenerator:
     
     def _find_move_type(self, move_name: str) -> str:
         """Find the type of a move by name."""
-        for type_name, categories in self.moves.items():
-            for category, moves in categories.items():
-                for move in moves:
-                    if move["name"] == move_name:
-                        return type_name
-        return "normal"
+        entry = self._move_index.get(move_name)
+        return entry[0] if entry else "normal"
     
     def _find_move_category(self, move_name: str) -> str:
         """Find the category (physical/special/status) of a move."""
-        for type_name, categories in self.moves.items():
-            for category, moves in categories.items():
-                for move in moves:
-                    if move["name"] == move_name:
-                        return category
-        return "physical"
+        entry = self._move_index.get(move_name)
+        return entry[1] if entry else "physical"
     
     def display(self, moveset: dict) -> str:
         """Format moveset for display."""
@@ -279,6 +457,20 @@ class MoveGenerator:
         return "\n".join(output)
 
 
+# Global instance
+_move_generator = None
+_move_generator_lock = threading.Lock()
+
+def get_move_generator() -> MoveGenerator:
+    """Get global move generator instance."""
+    global _move_generator
+    if _move_generator is None:
+        with _move_generator_lock:
+            if _move_generator is None:
+                _move_generator = MoveGenerator()
+    return _move_generator
+
+
 def main():
     """Test the move generator."""
     # Sample Pokemon data
@@ -296,7 +488,7 @@ def main():
         "tier": "fully_evolved"
     }
     
-    generator = MoveGenerator()
+    generator = get_move_generator()
     moveset = generator.generate_moveset(test_pokemon)
     
     print(f"\nMOVESET FOR {test_pokemon['name'].upper()}")
@@ -3,13 +3,17 @@ PokéDream Pokédex Database
 Simple JSON-based storage for all created Pokemon.
 """
 
+import bisect
 import json
 import os
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 import hashlib
 
+from src.json_store import SnapshotWriter
+
 
 class PokedexDB:
     """Manages the global Pokédex of created Pokemon."""
@@ -17,6 +21,12 @@ class PokedexDB:
     def __init__(self, db_path: str = "data/pokedex.json"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(exist_ok=True)
+        self._lock = threading.RLock()
+        self._version = 0
+        self._writer = SnapshotWriter(self.db_path)
+        # Bumped whenever a Hall of Fame badge changes, for cached views
+        self.badge_revision = 0
+        self._listeners = []
         self._load()
     
     def _load(self):
@@ -32,11 +42,31 @@ class PokedexDB:
                 "created_at": datetime.now().isoformat(),
             }
             self._save()
+        self._build_index()
+    
+    def _build_index(self):
+        """Index Pokémon by dex number and by added_at for fast lookups."""
+        self._by_dex = {p.get("dex_number"): p for p in self.data["pokemon"]}
+        
+        # Pokémon sorted by added_at, with a parallel list of keys to bisect
+        self._by_added = sorted(self.data["pokemon"], key=self._added_key)
+        self._added_keys = [self._added_key(p) for p in self._by_added]
+    
+    @staticmethod
+    def _added_key(pokemon: dict) -> str:
+        # ISO timestamps sort chronologically as strings
+        return pokemon.get("added_at", "2000-01-01")
+    
+    def _snapshot(self) -> tuple:
+        """Serialize the data under the store lock."""
+        with self._lock:
+            self._version += 1
+            return self._version, json.dumps(self.data, indent=2)
     
     def _save(self):
         """Save database to disk."""
-        with open(self.db_path, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        version, text = self._snapshot()
+        self._writer.write(version, text)
     
     def get_all_names(self) -> list:
         """Get all existing Pokemon names (for duplicate prevention)."""
@@ -51,31 +81,56 @@ class PokedexDB:
         Add a new Pokemon to the Pokédex.
         Returns the Pokemon with assigned dex number.
         """
-        # Assign dex number
-        dex_number = self.data["next_dex_number"]
-        pokemon["dex_number"] = dex_number
-        pokemon["added_at"] = datetime.now().isoformat()
+        with self._lock:
+            # Assign dex number
+            dex_number = self.data["next_dex_number"]
+            self.data["next_dex_number"] = dex_number + 1
+            pokemon["dex_number"] = dex_number
+            pokemon["added_at"] = datetime.now().isoformat()
+            
+            # Generate unique ID
+            pokemon["id"] = f"pkmn_{dex_number:04d}"
+            
+            # Add to list
+            self.data["pokemon"].append(pokemon)
+            self._by_dex[dex_number] = pokemon
+            
+            key = pokemon["added_at"]
+            if not self._added_keys or key >= self._added_keys[-1]:
+                self._added_keys.append(key)
+                self._by_added.append(pokemon)
+            else:
+                i = bisect.bisect_right(self._added_keys, key)
+                self._added_keys.insert(i, key)
+                self._by_added.insert(i, pokemon)
         
-        # Generate unique ID
-        pokemon["id"] = f"pkmn_{dex_number:04d}"
+        self._save()
         
-        # Add to list
-        self.data["pokemon"].append(pokemon)
-        self.data["next_dex_number"] = dex_number + 1
+        for callback in self._listeners:
+            callback(pokemon)
         
-        self._save()
         return pokemon
     
+    def subscribe(self, callback):
+        """
+        Register a callback(pokemon) run after each Pokémon is added.
+        
+        Callbacks run outside the database lock, once the new entry is saved.
+        """
+        self._listeners.append(callback)
+    
     def get_all(self) -> list:
         """Get all Pokemon in the Pokédex."""
         return self.data["pokemon"]
     
     def get_by_dex_number(self, dex_number: int) -> Optional[dict]:
         """Get a Pokemon by its Pokédex number."""
-        for p in self.data["pokemon"]:
-            if p.get("dex_number") == dex_number:
-                return p
-        return None
+        return self._by_dex.get(dex_number)
+    
+    def get_many(self, dex_numbers) -> dict:
+        """Get several Pokemon at once, as a dex_number -> Pokemon dict."""
+        by_dex = self._by_dex
+        return {n: by_dex[n] for n in dex_numbers if n in by_dex}
     
     def get_by_id(self, pokemon_id: str) -> Optional[dict]:
         """Get a Pokemon by its ID."""
@@ -133,18 +188,20 @@ class PokedexDB:
         return [p for p in self.data["pokemon"] 
                 if query in p.get("name", "").lower()]
     
+    def get_added_since(self, cutoff: datetime) -> list:
+        """Get all Pokemon added at or after a cutoff, oldest first."""
+        with self._lock:
+            i = bisect.bisect_left(self._added_keys, cutoff.isoformat())
+            return self._by_added[i:]
+    
     def get_count(self) -> int:
         """Get total number of Pokemon."""
         return len(self.data["pokemon"])
     
     def get_recent(self, limit: int = 10) -> list:
         """Get most recently added Pokemon."""
-        sorted_pokemon = sorted(
-            self.data["pokemon"],
-            key=lambda x: x.get("added_at", ""),
-            reverse=True
-        )
-        return sorted_pokemon[:limit]
+        with self._lock:
+            return self._by_added[-limit:][::-1] if limit > 0 else []
     
     def get_stats(self) -> dict:
         """Get Pokédex statistics."""
@@ -162,6 +219,26 @@ class PokedexDB:
             "region": self.data["region"],
         }
     
+    def mark_challenge_completed(self, pokemon_id: int) -> bool:
+        """
+        Flag a Pokémon as created for a daily challenge.
+        
+        Args:
+            pokemon_id: Pokédex number
+        
+        Returns:
+            True if successful, False if Pokémon not found
+        """
+        with self._lock:
+            pokemon = self.get_by_dex_number(pokemon_id)
+            if not pokemon:
+                return False
+            
+            pokemon["challenge_completed"] = True
+        
+        self._save()
+        return True
+    
     # ==================== HALL OF FAME METHODS ====================
     
     def update_pokemon_hof_badge(self, pokemon_id: int, badge: str) -> bool:
@@ -175,11 +252,14 @@ class PokedexDB:
         Returns:
             True if successful, False if Pokémon not found
         """
-        pokemon = self.get_by_dex_number(pokemon_id)
-        if not pokemon:
-            return False
+        with self._lock:
+            pokemon = self.get_by_dex_number(pokemon_id)
+            if not pokemon:
+                return False
+            
+            pokemon["hall_of_fame_badge"] = badge
+            self.badge_revision += 1
         
-        pokemon["hall_of_fame_badge"] = badge
         self._save()
         return True
 
@@ -190,12 +270,15 @@ class PokedexDB:
 
 # Global instance
 _db = None
+_db_lock = threading.Lock()
 
 def get_db() -> PokedexDB:
     """Get the global database instance."""
     global _db
     if _db is None:
-        _db = PokedexDB()
+        with _db_lock:
+            if _db is None:
+                _db = PokedexDB()
     return _db
 
 
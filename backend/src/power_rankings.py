@@ -0,0 +1,399 @@
+"""
+PokéDream Power Rankings
+Round-robin Monte Carlo battles across the Pokédex, ranked per tier and type.
+
+Every pair of Pokémon (or, with scope "tier", every pair within a tier)
+fights a batch of simulated battles, and each Pokémon is scored by its
+expected share of wins, with draws counting half. Results are kept as
+running win and game totals, so a refresh only plays the rows of Pokémon
+added since the last one: a new Pokémon battles everyone before it.
+
+Large refreshes are split across a process pool. The stacked battle
+profiles are copied once into shared memory and every worker maps them,
+so rows are handed out as (start, stop) ranges instead of pickled stats.
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.battle_engine import simulate_pairs
+from src.damage_matrix import best_move_damage, get_damage_matrix
+from src.json_store import SnapshotWriter
+
+
+PAIR_BLOCK = 2048  # opponents simulated together for one row
+POOL_THRESHOLD = 50_000  # fewer new pairs than this are played in-process
+
+
+def _rows(profiles: Dict[str, np.ndarray], start: int, stop: int) -> Dict[str, np.ndarray]:
+    return {key: values[start:stop] for key, values in profiles.items()}
+
+
+def _play_rows(
+    profiles: Dict[str, np.ndarray],
+    start: int,
+    stop: int,
+    simulations: int,
+    seed: int
+) -> np.ndarray:
+    """
+    Play rows start..stop-1 of the round robin: row r battles Pokémon 0..r-1.
+    
+    Returns:
+        Expected wins gained by each of Pokémon 0..stop-1
+    """
+    wins = np.zeros(stop)
+    
+    for r in range(start, stop):
+        # Seeded per row, so results don't depend on how rows are chunked
+        rng = np.random.default_rng([seed, r])
+        row = _rows(profiles, r, r + 1)
+        
+        for first in range(0, r, PAIR_BLOCK):
+            last = min(first + PAIR_BLOCK, r)
+            opponents = _rows(profiles, first, last)
+            base_a, accuracy_a = best_move_damage(row, opponents)
+            base_b, accuracy_b = best_move_damage(opponents, row)
+            
+            a_won, b_won, _ = simulate_pairs(
+                rng,
+                hp_a=np.repeat(row["hp"], last - first),
+                hp_b=opponents["hp"],
+                speed_a=np.repeat(row["speed"], last - first),
+                speed_b=opponents["speed"],
+                base_a=base_a[0],
+                base_b=base_b[:, 0],
+                accuracy_a=accuracy_a[0],
+                accuracy_b=accuracy_b[:, 0],
+                simulations=simulations,
+            )
+            
+            a_rate = a_won.mean(axis=1)
+            b_rate = b_won.mean(axis=1)
+            score = a_rate + (1 - a_rate - b_rate) / 2
+            wins[r] += score.sum()
+            wins[first:last] += 1 - score
+    
+    return wins
+
+
+def _share(profiles: Dict[str, np.ndarray]) -> Tuple[SharedMemory, List[tuple]]:
+    """Copy profiles into one shared memory block and describe its layout."""
+    shm = SharedMemory(create=True, size=max(1, sum(a.nbytes for a in profiles.values())))
+    layout = []
+    offset = 0
+    for key, values in profiles.items():
+        view = np.ndarray(values.shape, values.dtype, buffer=shm.buf, offset=offset)
+        view[...] = values
+        layout.append((key, values.shape, values.dtype.str, offset))
+        offset += values.nbytes
+    return shm, layout
+
+
+# Worker process state, set by _init_worker
+_worker_shm = None
+_worker_profiles = None
+
+def _init_worker(shm_name: str, layout: List[tuple]):
+    """Map the shared profiles in a worker process."""
+    global _worker_shm, _worker_profiles
+    _worker_shm = SharedMemory(name=shm_name)
+    _worker_profiles = {
+        key: np.ndarray(shape, dtype, buffer=_worker_shm.buf, offset=offset)
+        for key, shape, dtype, offset in layout
+    }
+
+
+def _worker_rows(start: int, stop: int, simulations: int, seed: int) -> np.ndarray:
+    return _play_rows(_worker_profiles, start, stop, simulations, seed)
+
+
+class PowerRankings:
+    """Incremental round-robin power rankings."""
+    
+    def __init__(
+        self,
+        db_path: str = "data/power_rankings.json",
+        scope: str = "all",
+        simulations: int = 100,
+        workers: Optional[int] = None,
+        interval: float = 3600.0,
+        seed: int = 0
+    ):
+        """
+        Args:
+            db_path: Where win and game totals are stored
+            scope: "all" for a Pokédex-wide round robin, "tier" for one per tier
+            simulations: Battles simulated per pair
+            workers: Process pool size (defaults to the CPU count)
+            interval: Seconds between background refreshes
+            seed: Base RNG seed, so a refresh is reproducible
+        """
+        if scope not in ("all", "tier"):
+            raise ValueError(f"Unknown power ranking scope: {scope}")
+        
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(exist_ok=True)
+        self.scope = scope
+        self.simulations = simulations
+        self.workers = workers or os.cpu_count() or 1
+        self.interval = interval
+        self.seed = seed
+        
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._version = 0
+        self._writer = SnapshotWriter(self.db_path)
+        self._stop = threading.Event()
+        self._thread = None
+        self._load()
+    
+    def _load(self):
+        """Load totals from disk, starting over if they were played with another scope."""
+        self._entries = {}
+        self.updated_at = None
+        
+        if self.db_path.exists():
+            with open(self.db_path, 'r') as f:
+                data = json.load(f)
+            if data.get("scope") == self.scope:
+                self._entries = {int(k): v for k, v in data["pokemon"].items()}
+                self.updated_at = data.get("updated_at")
+        
+        self._publish()
+    
+    def _snapshot(self) -> tuple:
+        """Serialize the totals under the store lock."""
+        with self._lock:
+            self._version += 1
+            return self._version, json.dumps({
+                "scope": self.scope,
+                "updated_at": self.updated_at,
+                "pokemon": {str(k): v for k, v in self._entries.items()},
+            })
+    
+    def _save(self):
+        """Save totals to disk."""
+        version, text = self._snapshot()
+        self._writer.write(version, text)
+    
+    def _publish(self):
+        """Rebuild the ranked tables. Called with the lock held (or before sharing)."""
+        ranked = sorted(
+            self._entries.items(),
+            key=lambda item: (-item[1]["wins"] / max(item[1]["games"], 1), item[0])
+        )
+        
+        self._overall = []
+        self._by_tier = {}
+        self._by_type = {}
+        for pokemon_id, entry in ranked:
+            row = {
+                "pokemon_id": pokemon_id,
+                "score": round(entry["wins"] / max(entry["games"], 1), 3),
+                "wins": round(entry["wins"], 1),
+                "games": entry["games"],
+            }
+            self._overall.append(row)
+            self._by_tier.setdefault(entry["tier"], []).append(row)
+            for pokemon_type in entry["types"]:
+                self._by_type.setdefault(pokemon_type, []).append(row)
+    
+    # ==================== ROUND ROBIN ====================
+    
+    def _chunks(self, start: int, stop: int) -> List[Tuple[int, int]]:
+        """Split rows into ranges of roughly equal pair counts (row r plays r pairs)."""
+        total = sum(range(start, stop))
+        target = max(1, total // (self.workers * 4))
+        
+        chunks = []
+        chunk_start = start
+        pairs = 0
+        for r in range(start, stop):
+            pairs += r
+            if pairs >= target:
+                chunks.append((chunk_start, r + 1))
+                chunk_start = r + 1
+                pairs = 0
+        if chunk_start < stop:
+            chunks.append((chunk_start, stop))
+        return chunks
+    
+    def _round_robin(self, ordered: List[dict], known: int) -> np.ndarray:
+        """
+        Play every pair involving ordered[known:], given earlier pairs are done.
+        
+        Returns:
+            Expected wins gained by each Pokémon in `ordered`
+        """
+        profiles = get_damage_matrix().build_profiles(ordered)
+        n = len(ordered)
+        new_pairs = sum(range(known, n))
+        
+        if new_pairs < POOL_THRESHOLD or self.workers == 1:
+            return _play_rows(profiles, known, n, self.simulations, self.seed)
+        
+        wins = np.zeros(n)
+        shm, layout = _share(profiles)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(shm.name, layout)
+            ) as pool:
+                futures = [
+                    pool.submit(_worker_rows, start, stop, self.simulations, self.seed)
+                    for start, stop in self._chunks(known, n)
+                ]
+                for future in futures:
+                    partial = future.result()
+                    wins[:len(partial)] += partial
+        finally:
+            shm.close()
+            shm.unlink()
+        
+        return wins
+    
+    def refresh(self, pokemon_list: List[dict]) -> int:
+        """
+        Play the round robin for Pokémon added since the last refresh.
+        
+        Returns:
+            Number of newly ranked Pokémon
+        """
+        with self._refresh_lock:
+            with self._lock:
+                entries = {k: dict(v) for k, v in self._entries.items()}
+            
+            new = [p for p in pokemon_list if p["dex_number"] not in entries]
+            if not new:
+                return 0
+            new_ids = {p["dex_number"] for p in new}
+            
+            for pokemon in new:
+                entries[pokemon["dex_number"]] = {
+                    "wins": 0.0,
+                    "games": 0,
+                    "tier": pokemon.get("tier", "unknown"),
+                    "types": [t.lower() for t in pokemon.get("types", []) if t],
+                }
+            
+            groups = {}
+            for pokemon in pokemon_list:
+                key = entries[pokemon["dex_number"]]["tier"] if self.scope == "tier" else None
+                groups.setdefault(key, []).append(pokemon)
+            
+            for members in groups.values():
+                # Already-ranked Pokémon first, so only the new rows are played
+                ordered = sorted(members, key=lambda p: (p["dex_number"] in new_ids, p["dex_number"]))
+                known = sum(1 for p in ordered if p["dex_number"] not in new_ids)
+                if known == len(ordered):
+                    continue
+                
+                wins = self._round_robin(ordered, known)
+                n = len(ordered)
+                for i, pokemon in enumerate(ordered):
+                    entry = entries[pokemon["dex_number"]]
+                    entry["wins"] += float(wins[i])
+                    entry["games"] += n - 1 if i >= known else n - known
+            
+            with self._lock:
+                self._entries = entries
+                self.updated_at = datetime.now().isoformat()
+                self._publish()
+            self._save()
+            
+            return len(new)
+    
+    # ==================== SCHEDULE ====================
+    
+    def start(self, get_pokemon):
+        """
+        Refresh in a background thread every `interval` seconds.
+        
+        Args:
+            get_pokemon: Callable returning the current Pokédex entries
+        """
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, args=(get_pokemon,), name="power-rankings", daemon=True
+            )
+            self._thread.start()
+    
+    def stop(self):
+        """Stop the refresh thread and wait for a running refresh to finish."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+    
+    def _run(self, get_pokemon):
+        while not self._stop.is_set():
+            try:
+                added = self.refresh(get_pokemon())
+                if added:
+                    print(f"✓ Power rankings updated: {added} new Pokémon")
+            except Exception as e:
+                print(f"⚠ Power rankings refresh failed: {e}")
+            
+            self._stop.wait(self.interval)
+    
+    # ==================== QUERIES ====================
+    
+    def get_rankings(
+        self,
+        tier: str = None,
+        pokemon_type: str = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> Tuple[List[Dict], int]:
+        """
+        Get a page of power rankings, overall or within a tier or type.
+        
+        Returns:
+            (rankings, total): rows with pokemon_id, score, wins, games and rank
+        """
+        with self._lock:
+            if tier:
+                table = self._by_tier.get(tier, [])
+            elif pokemon_type:
+                table = self._by_type.get(pokemon_type.lower(), [])
+            else:
+                table = self._overall
+            
+            page = [
+                {**row, "rank": offset + i + 1}
+                for i, row in enumerate(table[offset:offset + limit])
+            ]
+            return page, len(table)
+
+
+# Global instance
+_power_rankings = None
+_power_rankings_lock = threading.Lock()
+
+def get_power_rankings() -> PowerRankings:
+    """Get global power rankings instance."""
+    global _power_rankings
+    if _power_rankings is None:
+        with _power_rankings_lock:
+            if _power_rankings is None:
+                workers = os.getenv("POWER_RANKINGS_WORKERS")
+                _power_rankings = PowerRankings(
+                    scope=os.getenv("POWER_RANKINGS_SCOPE", "all"),
+                    simulations=int(os.getenv("POWER_RANKINGS_SIMULATIONS", 100)),
+                    workers=int(workers) if workers else None,
+                    interval=float(os.getenv("POWER_RANKINGS_INTERVAL", 3600))
+                )
+    return _power_rankings
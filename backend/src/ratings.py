@@ -0,0 +1,270 @@
+"""
+PokéDream Ratings
+Elo ratings for Pokémon, updated from head-to-head tournament results.
+
+Ratings and game counts live in typed arrays indexed by dex number. Rated
+Pokémon are also counted in a Fenwick tree over whole rating points, so
+"rank of X" and "the Nth best" are prefix-sum queries, and a page of the
+leaderboard costs a logarithmic search plus the page itself. Each rating
+point's members are kept sorted as ratings change, so ranking within a
+crowded point is a bisect rather than a sort.
+"""
+
+import bisect
+import json
+import os
+import threading
+from array import array
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from src.json_store import SnapshotWriter
+
+
+class RatingTable:
+    """Elo rating per Pokémon with order-statistics ranking."""
+    
+    INITIAL_RATING = 1500.0
+    RATING_BUCKETS = 4096  # whole rating points tracked by the ranking tree
+    
+    def __init__(
+        self,
+        db_path: str = "data/ratings.json",
+        k_factor: float = 32.0,
+        vote_k_factor: float = 0.0
+    ):
+        """
+        Args:
+            db_path: Where ratings are stored
+            k_factor: Elo K for a resolved matchup
+            vote_k_factor: Elo K for a single vote (0 disables per-vote updates)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(exist_ok=True)
+        self.k_factor = k_factor
+        self.vote_k_factor = vote_k_factor
+        self._lock = threading.RLock()
+        self._version = 0
+        self._writer = SnapshotWriter(self.db_path)
+        self._load()
+    
+    def _load(self):
+        """Load ratings from disk and build the ranking tree."""
+        self._ratings = array('d')
+        self._games = array('I')
+        self._tree = [0] * (self.RATING_BUCKETS + 1)
+        self._buckets = {}
+        self._rated = 0
+        
+        if self.db_path.exists():
+            with open(self.db_path, 'r') as f:
+                data = json.load(f)
+            for pokemon_id, (rating, games) in data["ratings"].items():
+                pokemon_id = int(pokemon_id)
+                self._grow(pokemon_id)
+                self._ratings[pokemon_id] = rating
+                self._games[pokemon_id] = games
+                self._rank_add(pokemon_id)
+    
+    def _snapshot(self) -> tuple:
+        """Serialize the ratings under the store lock."""
+        with self._lock:
+            self._version += 1
+            ratings = {
+                str(pokemon_id): [self._ratings[pokemon_id], games]
+                for pokemon_id, games in enumerate(self._games)
+                if games
+            }
+            return self._version, json.dumps({
+                "updated_at": datetime.now().isoformat(),
+                "ratings": ratings,
+            })
+    
+    def _save(self):
+        """Save ratings to disk."""
+        version, text = self._snapshot()
+        self._writer.write(version, text)
+    
+    def flush(self):
+        """Write ratings changed by per-vote updates, which aren't saved one by one."""
+        self._save()
+    
+    # ==================== RANKING TREE ====================
+    
+    def _grow(self, pokemon_id: int):
+        """Extend the arrays to cover a dex number."""
+        missing = pokemon_id + 1 - len(self._ratings)
+        if missing > 0:
+            self._ratings.extend([self.INITIAL_RATING] * missing)
+            self._games.extend([0] * missing)
+    
+    def _bucket(self, rating: float) -> int:
+        return min(max(int(rating), 0), self.RATING_BUCKETS - 1)
+    
+    def _tree_add(self, bucket: int, delta: int):
+        i = bucket + 1
+        while i <= self.RATING_BUCKETS:
+            self._tree[i] += delta
+            i += i & -i
+    
+    def _tree_prefix(self, bucket: int) -> int:
+        """Number of rated Pokémon in buckets 0..bucket."""
+        total = 0
+        i = bucket + 1
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+    
+    def _tree_find(self, k: int) -> int:
+        """Lowest bucket whose prefix count reaches k (1-based)."""
+        position = 0
+        step = 1 << (self.RATING_BUCKETS.bit_length() - 1)
+        while step:
+            nxt = position + step
+            if nxt <= self.RATING_BUCKETS and self._tree[nxt] < k:
+                position = nxt
+                k -= self._tree[nxt]
+            step >>= 1
+        # Tree index position + 1 is 1-based, so the bucket is `position`
+        return position
+    
+    def _member_key(self, pokemon_id: int) -> tuple:
+        """Sort key within a bucket: best first, then by dex number."""
+        return (-self._ratings[pokemon_id], pokemon_id)
+    
+    def _rank_add(self, pokemon_id: int):
+        bucket = self._bucket(self._ratings[pokemon_id])
+        bisect.insort(self._buckets.setdefault(bucket, []), self._member_key(pokemon_id))
+        self._tree_add(bucket, 1)
+        self._rated += 1
+    
+    def _rank_remove(self, pokemon_id: int):
+        bucket = self._bucket(self._ratings[pokemon_id])
+        members = self._buckets[bucket]
+        del members[bisect.bisect_left(members, self._member_key(pokemon_id))]
+        if not members:
+            del self._buckets[bucket]
+        self._tree_add(bucket, -1)
+        self._rated -= 1
+    
+    # ==================== UPDATES ====================
+    
+    def _play(self, winner_id: int, loser_id: int, k: float):
+        """Apply one Elo result. Called with the lock held."""
+        self._grow(max(winner_id, loser_id))
+        
+        for pokemon_id in (winner_id, loser_id):
+            if self._games[pokemon_id]:
+                self._rank_remove(pokemon_id)
+        
+        winner = self._ratings[winner_id]
+        loser = self._ratings[loser_id]
+        expected = 1.0 / (1.0 + 10 ** ((loser - winner) / 400.0))
+        change = k * (1.0 - expected)
+        
+        self._ratings[winner_id] = winner + change
+        self._ratings[loser_id] = loser - change
+        self._games[winner_id] += 1
+        self._games[loser_id] += 1
+        
+        self._rank_add(winner_id)
+        self._rank_add(loser_id)
+    
+    def record_result(self, winner_id: int, loser_id: int):
+        """Update ratings from a resolved matchup."""
+        with self._lock:
+            self._play(winner_id, loser_id, self.k_factor)
+        self._save()
+    
+    def record_vote(self, voted_id: int, other_id: int):
+        """Nudge ratings from a single vote, if per-vote updates are enabled."""
+        if not self.vote_k_factor:
+            return
+        with self._lock:
+            self._play(voted_id, other_id, self.vote_k_factor)
+    
+    def record_tournament(self, event: str, data: Dict):
+        """Rate resolved matchups. Subscribed to the tournament system."""
+        if event != "resolved":
+            return
+        
+        winner_id = data["winner_id"]
+        loser_id = data["pokemon_b_id"] if winner_id == data["pokemon_a_id"] else data["pokemon_a_id"]
+        self.record_result(winner_id, loser_id)
+    
+    # ==================== QUERIES ====================
+    
+    def get_rating(self, pokemon_id: int) -> float:
+        """Get a Pokémon's rating (the initial rating if it never played)."""
+        if 0 <= pokemon_id < len(self._ratings):
+            return self._ratings[pokemon_id]
+        return self.INITIAL_RATING
+    
+    def get_count(self) -> int:
+        """Get the number of rated Pokémon."""
+        return self._rated
+    
+    def get_rank(self, pokemon_id: int) -> Optional[Dict]:
+        """
+        Get a Pokémon's rating and 1-based rank.
+        
+        Returns:
+            Dict with pokemon_id, rating, games and rank, or None if unrated
+        """
+        with self._lock:
+            if not (0 <= pokemon_id < len(self._games)) or not self._games[pokemon_id]:
+                return None
+            
+            bucket = self._bucket(self._ratings[pokemon_id])
+            above = self._rated - self._tree_prefix(bucket)
+            rank = above + bisect.bisect_left(self._buckets[bucket], self._member_key(pokemon_id)) + 1
+            
+            return {
+                "pokemon_id": pokemon_id,
+                "rating": round(self._ratings[pokemon_id], 1),
+                "games": self._games[pokemon_id],
+                "rank": rank,
+            }
+    
+    def get_top(self, limit: int = 100, offset: int = 0) -> List[Dict]:
+        """Get rated Pokémon, best first. A negative offset counts as 0."""
+        with self._lock:
+            results = []
+            position = max(offset, 0)  # 0-based rank of the next entry
+            
+            while len(results) < limit and position < self._rated:
+                # Bucket holding the entry, counted from the bottom
+                bucket = self._tree_find(self._rated - position)
+                above = self._rated - self._tree_prefix(bucket)
+                members = self._buckets[bucket]
+                
+                first = position - above
+                last = min(len(members), first + limit - len(results))
+                for _, pokemon_id in members[first:last]:
+                    position += 1
+                    results.append({
+                        "pokemon_id": pokemon_id,
+                        "rating": round(self._ratings[pokemon_id], 1),
+                        "games": self._games[pokemon_id],
+                        "rank": position,
+                    })
+            
+            return results
+
+
+# Global instance
+_ratings = None
+_ratings_lock = threading.Lock()
+
+def get_ratings() -> RatingTable:
+    """Get global rating table instance."""
+    global _ratings
+    if _ratings is None:
+        with _ratings_lock:
+            if _ratings is None:
+                _ratings = RatingTable(
+                    vote_k_factor=float(os.getenv("RATING_VOTE_K", 0))
+                )
+    return _ratings
@@ -0,0 +1,145 @@
+"""
+PokéDream Tally Broadcaster
+Pushes live matchup vote tallies to Server-Sent Event subscribers.
+
+Votes only mark their matchup as dirty. Once per tick a single broadcaster
+task reads the tallies of the dirty matchups, builds one event and fans it
+out to every subscriber, so the cost per tick doesn't depend on how many
+people are watching.
+"""
+
+import asyncio
+import json
+import threading
+from typing import AsyncIterator, Callable, Dict, Optional, Tuple
+
+
+class TallyBroadcaster:
+    """Coalesces vote updates into periodic SSE tally deltas."""
+    
+    def __init__(
+        self,
+        read_tally: Callable[[str], Optional[Tuple[int, int]]],
+        tick_interval: float = 0.25,
+        keepalive_interval: float = 15.0,
+        max_pending: int = 32
+    ):
+        """
+        Args:
+            read_tally: Returns (votes_a, votes_b) for a matchup_id, or None
+            tick_interval: Seconds between broadcasts
+            keepalive_interval: Seconds of silence before a keepalive comment
+            max_pending: Events buffered per subscriber before old ones are dropped
+        """
+        self.read_tally = read_tally
+        self.tick_interval = tick_interval
+        self.keepalive_interval = keepalive_interval
+        self.max_pending = max_pending
+        
+        self._dirty = set()
+        self._dirty_lock = threading.Lock()
+        self._last = {}
+        self._subscribers = set()
+        self._task = None
+    
+    def prime(self, tallies: Dict[str, Tuple[int, int]]):
+        """Set the baseline tallies that the first deltas are computed against."""
+        self._last.update(tallies)
+    
+    def mark_dirty(self, matchup_id: str, pokemon_id: int = None):
+        """Record that a matchup's tally changed. Safe to call from any thread."""
+        with self._dirty_lock:
+            self._dirty.add(matchup_id)
+    
+    def start(self):
+        """Start the broadcast loop on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self):
+        """Stop the broadcast loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self):
+        """Broadcast coalesced deltas once per tick."""
+        while True:
+            await asyncio.sleep(self.tick_interval)
+            
+            event = self._collect()
+            if event is None:
+                continue
+            
+            for queue in list(self._subscribers):
+                if queue.full():
+                    # Slow client: drop its oldest event rather than block the others
+                    queue.get_nowait()
+                queue.put_nowait(event)
+    
+    def _collect(self) -> Optional[str]:
+        """Build one SSE event for every matchup that changed since the last tick."""
+        with self._dirty_lock:
+            dirty, self._dirty = self._dirty, set()
+        
+        updates = []
+        for matchup_id in sorted(dirty):
+            tally = self.read_tally(matchup_id)
+            if tally is None:
+                continue
+            
+            votes_a, votes_b = tally
+            last_a, last_b = self._last.get(matchup_id, (0, 0))
+            if (votes_a, votes_b) == (last_a, last_b):
+                continue
+            
+            self._last[matchup_id] = (votes_a, votes_b)
+            updates.append({
+                "matchup_id": matchup_id,
+                "votes_a": votes_a,
+                "votes_b": votes_b,
+                "delta_a": votes_a - last_a,
+                "delta_b": votes_b - last_b,
+            })
+        
+        if not updates or not self._subscribers:
+            return None
+        
+        return self._format("tally", {"matchups": updates})
+    
+    @staticmethod
+    def _format(event: str, data: Dict) -> str:
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+    
+    async def subscribe(self, initial: Dict[str, Tuple[int, int]] = None) -> AsyncIterator[str]:
+        """
+        Stream SSE events to one client until it disconnects.
+        
+        Args:
+            initial: Current tallies (matchup_id -> (votes_a, votes_b)) sent as a snapshot
+        """
+        queue = asyncio.Queue(maxsize=self.max_pending)
+        self._subscribers.add(queue)
+        
+        try:
+            snapshot = [
+                {"matchup_id": matchup_id, "votes_a": votes_a, "votes_b": votes_b}
+                for matchup_id, (votes_a, votes_b) in (initial or {}).items()
+            ]
+            yield self._format("snapshot", {"matchups": snapshot})
+            
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), timeout=self.keepalive_interval)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+        finally:
+            self._subscribers.discard(queue)
+    
+    def get_subscriber_count(self) -> int:
+        """Get the number of connected subscribers."""
+        return len(self._subscribers)
@@ -0,0 +1,139 @@
+"""
+PokéDream Tournament Scheduler
+Runs tournament progression in the background of the server process.
+
+Each tick advances rounds whose 3.5-day window has closed, seals the votes
+and archives the brackets of tournaments that just finished, and starts the
+next tournament once none is running. Between ticks the thread sleeps until
+the next round deadline, so bracket work happens on time without waiting
+for a request.
+"""
+
+import os
+import threading
+from datetime import datetime
+from typing import Optional
+
+from src.pokedex_db import get_db
+from src.ratings import get_ratings
+from src.tournament_system import get_tournament_system
+from src.voting_system import get_voting_system
+
+
+class TournamentScheduler:
+    """Background thread that advances rounds and rolls over tournaments."""
+    
+    def __init__(
+        self,
+        min_participants: int = 16,
+        max_sleep: float = 60.0,
+        tournament_size: int = 16,
+        seed_by_rating: bool = False
+    ):
+        """
+        Args:
+            min_participants: Pokémon needed in the Pokédex to start a tournament
+            tournament_size: Entrants per tournament (32, 64, 128... for bigger events)
+            seed_by_rating: Seed brackets by Elo rating instead of at random
+            max_sleep: Longest wait between ticks, so new Pokémon or missed
+                deadlines (e.g. after a clock change) are picked up
+        """
+        self.min_participants = min_participants
+        self.max_sleep = max_sleep
+        self.tournament_size = tournament_size
+        self.seed_by_rating = seed_by_rating
+        
+        self._stop = threading.Event()
+        self._thread = None
+        self._reported_count = None
+    
+    def start(self):
+        """Start the scheduler thread."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="tournament-scheduler", daemon=True
+            )
+            self._thread.start()
+    
+    def stop(self):
+        """Stop the scheduler thread and wait for the current tick to finish."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+    
+    def _run(self):
+        """Tick, then sleep until the next deadline, until stopped."""
+        while not self._stop.is_set():
+            try:
+                next_deadline = self.tick()
+            except Exception as e:
+                print(f"⚠ Tournament scheduler tick failed: {e}")
+                next_deadline = None
+            
+            timeout = self.max_sleep
+            if next_deadline is not None:
+                until_deadline = (next_deadline - datetime.now()).total_seconds()
+                timeout = min(max(until_deadline, 0.0), self.max_sleep)
+            
+            self._stop.wait(timeout)
+    
+    def tick(self, now: datetime = None) -> Optional[datetime]:
+        """
+        Bring every tournament up to date.
+        
+        Returns:
+            The next round deadline, or None if no tournament is active
+        """
+        now = now or datetime.now()
+        tournament_system = get_tournament_system()
+        voting_system = get_voting_system()
+        db = get_db()
+        
+        for tournament in tournament_system.advance_due_rounds(now):
+            if tournament["status"] == "complete":
+                print(f"✓ Tournament complete: {tournament['id']} (champion #{tournament['champion_id']})")
+                if voting_system.seal_tournament(tournament["id"]):
+                    print(f"✓ Archived votes for tournament: {tournament['id']}")
+                if tournament_system.archive_tournament(tournament["id"]):
+                    print(f"✓ Archived tournament: {tournament['id']}")
+            else:
+                print(f"✓ Tournament {tournament['id']} advanced to round {tournament['current_round']}")
+        
+        if tournament_system.get_current_tournament() is None:
+            pokemon_count = db.get_count()
+            
+            if pokemon_count >= self.min_participants:
+                seed_by = get_ratings().get_rating if self.seed_by_rating else None
+                tournament = tournament_system.create_tournament(
+                    db, size=self.tournament_size, seed_by=seed_by
+                )
+                print(f"✓ Auto-created tournament: {tournament['id']}")
+                print(f"  Participants: {len(tournament['participants'])} Pokémon")
+                self._reported_count = None
+            elif pokemon_count != self._reported_count:
+                print(
+                    f"⚠ Need at least {self.min_participants} Pokémon to create "
+                    f"tournament (current: {pokemon_count})"
+                )
+                self._reported_count = pokemon_count
+        
+        return tournament_system.get_next_deadline()
+
+
+# Global instance
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+def get_tournament_scheduler() -> TournamentScheduler:
+    """Get global tournament scheduler instance."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = TournamentScheduler(
+                    tournament_size=int(os.getenv("TOURNAMENT_SIZE", 16)),
+                    seed_by_rating=os.getenv("TOURNAMENT_SEEDING") == "rating"
+                )
+    return _scheduler
@@ -1,21 +1,56 @@
 """
 PokéDream Tournament System
-Manages bi-weekly tournaments with 16 Pokémon brackets.
+Manages bi-weekly single-elimination tournaments (16 Pokémon by default).
+
+Only tournaments still in play live in data/tournaments.json, which is
+rewritten on every save. Completed tournaments are moved to a cold archive:
+
+    data/tournament_archive/<tournament_id>.json   full tournament, written once
+    data/tournament_archive/summaries.jsonl        one summary per tournament
 """
 
+import bisect
+import heapq
 import json
+import os
 import random
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict
+from typing import Callable, Optional, List, Dict, Tuple
+
+from src.bracket import advance_winner, bracket_size, build_bracket, round_count, tree_from_bracket
+from src.json_store import SnapshotWriter
 
 
 class TournamentSystem:
     """Manages tournament creation, progression, and voting."""
     
-    def __init__(self, db_path: str = "data/tournaments.json"):
+    # Archived tournaments kept in memory after being read back
+    ARCHIVE_CACHE_SIZE = 32
+    # Enriched bracket views kept in memory, least recently used evicted first
+    VIEW_CACHE_SIZE = 64
+    # Seconds live tally updates wait before being saved, so bursts share a write
+    TALLY_SAVE_DELAY = 1.0
+    
+    def __init__(
+        self,
+        db_path: str = "data/tournaments.json",
+        archive_path: str = "data/tournament_archive"
+    ):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(exist_ok=True)
+        self.archive_path = Path(archive_path)
+        self.archive_path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._version = 0
+        self._writer = SnapshotWriter(self.db_path)
+        # Enriched bracket views: tournament_id -> (cache key, view)
+        self._view_cache = OrderedDict()
+        self._revisions = {}
+        self._listeners = []
+        self._save_timer = None
         self._load()
     
     def _load(self):
@@ -30,245 +65,687 @@ class TournamentSystem:
                 "created_at": datetime.now().isoformat(),
             }
             self._save()
+        
+        self._load_archive()
+        
+        # A tournament can be in both stores if the process died mid-archive
+        hot = [t for t in self.data["tournaments"] if t["id"] not in self._archived_ids]
+        if len(hot) != len(self.data["tournaments"]):
+            self.data["tournaments"] = hot
+            self._save()
+        
+        # Tournaments created before the bracket engine have no array tree
+        for tournament in self.data["tournaments"]:
+            if "bracket_tree" not in tournament:
+                tree, size = tree_from_bracket(tournament["bracket"])
+                tournament["bracket_tree"] = tree
+                tournament["bracket_size"] = size
+                tournament["num_rounds"] = round_count(size)
+        
+        self._build_tournament_index()
+        self._refresh_matchup_index()
     
-    def _save(self):
-        """Save tournament database to disk."""
-        with open(self.db_path, 'w') as f:
-            json.dump(self.data, f, indent=2)
+    def _load_archive(self):
+        """Load the summaries of archived tournaments."""
+        self._summaries = []
+        self._summary_starts = []
+        self._archived_ids = set()
+        self._archived_per_season = {}
+        self._archive_cache = OrderedDict()
+        
+        summaries_path = self.archive_path / "summaries.jsonl"
+        if summaries_path.exists():
+            with open(summaries_path, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        self._add_summary(json.loads(line))
     
-    def get_current_tournament(self) -> Optional[Dict]:
-        """Get the currently active tournament."""
-        now = datetime.now()
+    def _add_summary(self, summary: Dict):
+        """Index an archived tournament's summary, keeping them sorted by start date."""
+        i = bisect.bisect_right(self._summary_starts, summary["start_date"])
+        self._summary_starts.insert(i, summary["start_date"])
+        self._summaries.insert(i, summary)
+        self._archived_ids.add(summary["id"])
+        season = summary["season"]
+        self._archived_per_season[season] = self._archived_per_season.get(season, 0) + 1
+    
+    @staticmethod
+    def _summarize(tournament: Dict) -> Dict:
+        """Build the history summary of a tournament."""
+        final_score = None
+        runner_up_id = None
+        
+        if tournament["status"] == "complete":
+            final = tournament["bracket"][f"round_{tournament['num_rounds']}"][0]
+            if final["winner_id"] == final["pokemon_a_id"]:
+                runner_up_id = final["pokemon_b_id"]
+                final_score = [final["votes_a"], final["votes_b"]]
+            else:
+                runner_up_id = final["pokemon_a_id"]
+                final_score = [final["votes_b"], final["votes_a"]]
+        
+        return {
+            "id": tournament["id"],
+            "season": tournament["season"],
+            "week": tournament["week"],
+            "start_date": tournament["start_date"],
+            "end_date": tournament["end_date"],
+            "status": tournament["status"],
+            "num_rounds": tournament["num_rounds"],
+            "champion_id": tournament["champion_id"],
+            "runner_up_id": runner_up_id,
+            "final_score": final_score,  # [champion votes, runner-up votes]
+            "participants": tournament["participants"],
+        }
+    
+    def archive_tournament(self, tournament_id: str) -> bool:
+        """
+        Move a completed tournament out of the hot store into the cold archive.
+        
+        Returns:
+            False if the tournament isn't in the hot store or isn't complete
+        """
+        with self._lock:
+            tournament = self._by_id.get(tournament_id)
+            if not tournament or tournament["status"] != "complete":
+                return False
+            
+            summary = self._summarize(tournament)
+            
+            tournament_path = self.archive_path / f"{tournament_id}.json"
+            tmp_path = tournament_path.with_suffix(".tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(tournament, f)
+            os.replace(tmp_path, tournament_path)
+            
+            with open(self.archive_path / "summaries.jsonl", 'a') as f:
+                f.write(json.dumps(summary) + "\n")
+            
+            self._add_summary(summary)
+            self.data["tournaments"].remove(tournament)
+            
+            self._save()
+            self._build_tournament_index()
+            self._refresh_matchup_index()
+            return True
+    
+    def _load_archived(self, tournament_id: str) -> Optional[Dict]:
+        """Read an archived tournament back from the cold store."""
+        with self._lock:
+            tournament = self._archive_cache.get(tournament_id)
+            if tournament is not None:
+                self._archive_cache.move_to_end(tournament_id)
+                return tournament
+            
+            if tournament_id not in self._archived_ids:
+                return None
+            
+            with open(self.archive_path / f"{tournament_id}.json", 'r') as f:
+                tournament = json.load(f)
+            
+            self._archive_cache[tournament_id] = tournament
+            if len(self._archive_cache) > self.ARCHIVE_CACHE_SIZE:
+                self._archive_cache.popitem(last=False)
+            return tournament
+    
+    def _build_tournament_index(self):
+        """
+        Index tournaments by ID and by their parsed [start, end] windows.
+        
+        Windows are sorted by start with a running maximum of end dates, so
+        the tournament covering a given time is found by bisecting the starts
+        and walking back only while an earlier window could still be open.
+        """
+        intervals = sorted(
+            (
+                datetime.fromisoformat(t["start_date"]),
+                datetime.fromisoformat(t["end_date"]),
+                t
+            )
+            for t in self.data["tournaments"]
+        )
+        
+        self._by_id = {t["id"]: t for t in self.data["tournaments"]}
+        self._interval_starts = [start for start, _, _ in intervals]
+        self._interval_ends = [end for _, end, _ in intervals]
+        self._interval_tournaments = [t for _, _, t in intervals]
+        self._interval_max_end = []
+        max_end = None
+        for end in self._interval_ends:
+            max_end = end if max_end is None or end > max_end else max_end
+            self._interval_max_end.append(max_end)
+        
+        # Cached (tournament, valid_until) for get_current_tournament
+        self._current_cache = (None, None)
+    
+    def _find_current(self, now: datetime):
+        """Find the tournament open at `now` and the time that answer expires."""
+        i = bisect.bisect_right(self._interval_starts, now)
+        next_start = self._interval_starts[i] if i < len(self._interval_starts) else None
+        
+        current = None
+        j = i - 1
+        while j >= 0 and self._interval_max_end[j] >= now:
+            if self._interval_ends[j] >= now:
+                current = j
+                break
+            j -= 1
+        
+        # The answer can change when the current window closes or the next opens
+        boundaries = [b for b in (next_start,) if b is not None]
+        if current is not None:
+            boundaries.append(self._interval_ends[current])
+        valid_until = min(boundaries) if boundaries else datetime.max
+        
+        tournament = self._interval_tournaments[current] if current is not None else None
+        return tournament, valid_until
+    
+    def _refresh_matchup_index(self):
+        """
+        Rebuild the indexes of active tournaments.
+        
+        The matchup_id -> active matchup index is used for vote validation.
+        Each entry holds the matchup, its tournament's voting window and the
+        trainer_id owning each of the two participants. The trainer_id ->
+        {tournament_id: [dex numbers]} index lists each trainer's entrants.
+        """
+        index = {}
+        entrants = {}
         
         for tournament in self.data["tournaments"]:
+            if tournament["status"] != "active":
+                continue
+            
             start = datetime.fromisoformat(tournament["start_date"])
             end = datetime.fromisoformat(tournament["end_date"])
+            owners = tournament.get("participant_trainers", {})
             
-            if start <= now <= end:
-                return tournament
+            for dex_number, trainer_id in owners.items():
+                if trainer_id:
+                    entrants.setdefault(trainer_id, {}).setdefault(tournament["id"], []).append(int(dex_number))
+            round_key = f"round_{tournament['current_round']}"
+            
+            for matchup in tournament["bracket"].get(round_key, []):
+                if matchup["status"] != "active":
+                    continue
+                
+                a_id = matchup["pokemon_a_id"]
+                b_id = matchup["pokemon_b_id"]
+                index[matchup["matchup_id"]] = {
+                    "tournament_id": tournament["id"],
+                    "matchup": matchup,
+                    "start": start,
+                    "end": end,
+                    "owners": {
+                        a_id: owners.get(str(a_id)),
+                        b_id: owners.get(str(b_id)),
+                    },
+                }
+        
+        self._matchup_index = index
+        self._trainer_entrants = entrants
+    
+    def subscribe(self, callback: Callable[[str, Dict], None]):
+        """
+        Register a callback for tournament lifecycle events.
         
-        return None
+        The callback gets (event, data): "created" and "completed" come with
+        the tournament, "resolved" with a matchup whose winner was just
+        decided. It runs under the store lock and must not call back in.
+        """
+        self._listeners.append(callback)
+    
+    def _notify(self, event: str, tournament: Dict):
+        for callback in self._listeners:
+            callback(event, tournament)
     
-    def create_tournament(self, pokedex_db) -> Dict:
+    def get_trainer_entrants(self, trainer_id: str, tournament_id: str) -> List[int]:
+        """Get the dex numbers a trainer has entered in an active tournament."""
+        return list(self._trainer_entrants.get(trainer_id, {}).get(tournament_id, []))
+    
+    def get_vote_target(self, matchup_id: str) -> Optional[Dict]:
         """
-        Create a new bi-weekly tournament with 16 Pokémon.
+        Look up an active matchup that is open for voting right now.
         
-        Selection criteria:
-        - Created within last 14 days
-        - Max 2 per type
-        - Random selection from eligible pool
+        Returns:
+            Index entry with tournament_id, matchup, start, end and owners
+            (pokemon_id -> trainer_id), or None if not votable
         """
-        now = datetime.now()
+        entry = self._matchup_index.get(matchup_id)
+        if not entry:
+            return None
         
-        # Calculate tournament dates (14 days)
-        start_date = now
-        end_date = now + timedelta(days=14)
+        now = datetime.now()
+        if not (entry["start"] <= now <= entry["end"]):
+            return None
         
-        # Calculate season and week
-        season = self.data["current_season"]
-        week = len([t for t in self.data["tournaments"] if t["season"] == season]) + 1
+        return entry
+    
+    def record_vote(self, matchup_id: str, pokemon_id: int):
+        """Add one vote to a live matchup's materialized tally and schedule a save."""
+        with self._lock:
+            entry = self._matchup_index.get(matchup_id)
+            if not entry:
+                return
+            
+            matchup = entry["matchup"]
+            if pokemon_id == matchup["pokemon_a_id"]:
+                matchup["votes_a"] += 1
+            elif pokemon_id == matchup["pokemon_b_id"]:
+                matchup["votes_b"] += 1
+            else:
+                return
+            
+            self._save_soon()
+    
+    def get_opponent(self, matchup_id: str, pokemon_id: int) -> Optional[int]:
+        """Get the other Pokémon in a live matchup."""
+        entry = self._matchup_index.get(matchup_id)
+        if not entry:
+            return None
+        
+        matchup = entry["matchup"]
+        if pokemon_id == matchup["pokemon_a_id"]:
+            return matchup["pokemon_b_id"]
+        if pokemon_id == matchup["pokemon_b_id"]:
+            return matchup["pokemon_a_id"]
+        return None
+    
+    def get_matchup_tally(self, matchup_id: str) -> Optional[Tuple[int, int]]:
+        """Get (votes_a, votes_b) for a live matchup, or None if it isn't active."""
+        entry = self._matchup_index.get(matchup_id)
+        if not entry:
+            return None
+        return entry["matchup"]["votes_a"], entry["matchup"]["votes_b"]
+    
+    def get_live_tallies(self) -> Dict[str, Tuple[int, int]]:
+        """Get (votes_a, votes_b) for every live matchup."""
+        return {
+            matchup_id: (entry["matchup"]["votes_a"], entry["matchup"]["votes_b"])
+            for matchup_id, entry in self._matchup_index.items()
+        }
+    
+    def sync_tallies(self, voting_system):
+        """Reset live matchup tallies from the voting system's counters."""
+        for matchup_id, entry in self._matchup_index.items():
+            matchup = entry["matchup"]
+            counts = voting_system.get_matchup_votes(matchup_id)
+            matchup["votes_a"] = counts.get(matchup["pokemon_a_id"], 0)
+            matchup["votes_b"] = counts.get(matchup["pokemon_b_id"], 0)
+    
+    def ensure_participant_trainers(self, pokedex_db):
+        """Backfill participant -> trainer_id maps for tournaments created without one."""
+        with self._lock:
+            changed = False
+            
+            for tournament in self.data["tournaments"]:
+                if "participant_trainers" in tournament:
+                    continue
+                
+                owners = {}
+                for dex_number in tournament["participants"]:
+                    pokemon = pokedex_db.get_by_dex_number(dex_number)
+                    owners[str(dex_number)] = pokemon.get("trainer_id") if pokemon else None
+                tournament["participant_trainers"] = owners
+                changed = True
+            
+            if changed:
+                self._save()
+                self._refresh_matchup_index()
+    
+    def _snapshot(self) -> tuple:
+        """Serialize the data under the store lock."""
+        with self._lock:
+            self._version += 1
+            return self._version, json.dumps(self.data, indent=2)
+    
+    def _save(self):
+        """Save tournament database to disk."""
+        version, text = self._snapshot()
+        self._writer.write(version, text)
+    
+    def _save_soon(self):
+        """Schedule a save for tally updates. Called with the lock held."""
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(self.TALLY_SAVE_DELAY, self._deferred_save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def _deferred_save(self):
+        with self._lock:
+            self._save_timer = None
+        self._save()
+    
+    def flush(self):
+        """Write tally updates still waiting for a scheduled save."""
+        with self._lock:
+            timer, self._save_timer = self._save_timer, None
+        if timer is not None:
+            timer.cancel()
+            self._save()
+    
+    def get_current_tournament(self) -> Optional[Dict]:
+        """Get the currently active tournament."""
+        now = datetime.now()
         
-        # Get eligible Pokémon (created in last 14 days)
-        cutoff_date = now - timedelta(days=14)
-        all_pokemon = pokedex_db.get_all()
+        tournament, valid_until = self._current_cache
+        if valid_until is None or now >= valid_until:
+            with self._lock:
+                tournament, valid_until = self._find_current(now)
+                self._current_cache = (tournament, valid_until)
         
-        eligible = [
-            p for p in all_pokemon 
-            if datetime.fromisoformat(p.get("added_at", "2000-01-01")) >= cutoff_date
-        ]
+        return tournament
+    
+    def create_tournament(
+        self,
+        pokedex_db,
+        size: int = 16,
+        weight: Optional[Callable[[Dict], float]] = None,
+        seed_by: Optional[Callable[[int], float]] = None
+    ) -> Dict:
+        """
+        Create a new bi-weekly tournament.
         
-        # If not enough, expand to last 30 days
-        if len(eligible) < 16:
-            cutoff_date = now - timedelta(days=30)
-            eligible = [
-                p for p in all_pokemon 
-                if datetime.fromisoformat(p.get("added_at", "2000-01-01")) >= cutoff_date
-            ]
+        Args:
+            pokedex_db: Pokédex to draw entrants from
+            size: Number of entrants; brackets that aren't a power of two
+                are padded with byes
+            weight: Relative chance of a Pokémon being drawn (uniform if None)
+            seed_by: Seeding strength by dex number, e.g. a rating lookup;
+                the bracket is seeded randomly if None
         
-        # If still not enough, use most recent Pokémon
-        if len(eligible) < 16:
-            eligible = sorted(
-                all_pokemon, 
-                key=lambda p: p.get("added_at", "2000-01-01"), 
-                reverse=True
-            )[:32]  # Get more for filtering
+        Selection criteria:
+        - Created within last 14 days
+        - Max 2 per type
+        - Weighted random selection from eligible pool
+        """
+        with self._lock:
+            now = datetime.now()
+            
+            # Calculate tournament dates (14 days)
+            start_date = now
+            end_date = now + timedelta(days=14)
+            
+            # Calculate season and week
+            season = self.data["current_season"]
+            week = (
+                len([t for t in self.data["tournaments"] if t["season"] == season])
+                + self._archived_per_season.get(season, 0)
+                + 1
+            )
+            
+            # Get eligible Pokémon (created in last 14 days)
+            eligible = pokedex_db.get_added_since(now - timedelta(days=14))
+            
+            # If not enough, expand to last 30 days
+            if len(eligible) < size:
+                eligible = pokedex_db.get_added_since(now - timedelta(days=30))
+            
+            # If still not enough, use most recent Pokémon
+            if len(eligible) < size:
+                eligible = pokedex_db.get_recent(size * 2)  # Get more for filtering
+            
+            selected = self._sample_entrants(eligible, size, weight)
+            
+            if seed_by:
+                # Strongest first, placed by seed
+                selected.sort(key=lambda p: seed_by(p["dex_number"]), reverse=True)
+            else:
+                # Shuffle for random bracket seeding
+                random.shuffle(selected)
+            
+            tournament_id = f"s{season}w{week}"
+            entrants = [p["dex_number"] for p in selected]
+            bracket, tree = build_bracket(tournament_id, entrants, seeded=seed_by is not None)
+            slots = bracket_size(len(entrants))
+            
+            tournament = {
+                "id": tournament_id,
+                "season": season,
+                "week": week,
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+                "status": "active",
+                "current_round": 1,
+                "num_rounds": round_count(slots),
+                "bracket_size": slots,
+                "bracket": bracket,
+                "bracket_tree": tree,
+                "participants": entrants,
+                "participant_trainers": {
+                    str(p["dex_number"]): p.get("trainer_id") for p in selected
+                },
+                "champion_id": None,
+                "created_at": now.isoformat()
+            }
+            
+            self.data["tournaments"].append(tournament)
+            self._save()
+            self._build_tournament_index()
+            self._refresh_matchup_index()
+            self._notify("created", tournament)
+            
+            return tournament
+    
+    @staticmethod
+    def _sample_entrants(
+        candidates: List[Dict],
+        size: int,
+        weight: Optional[Callable[[Dict], float]] = None
+    ) -> List[Dict]:
+        """
+        Draw up to `size` entrants, with at most 2 per type where possible.
+        
+        Weighted reservoir sampling (Efraimidis-Spirakis): each candidate
+        draws the key u^(1/w) and candidates are considered in descending key
+        order. Heapifying the keys is linear, and only the candidates actually
+        considered are popped. The scan runs until the field is full or the
+        pool runs out; only then do candidates skipped by the type rule pad
+        the field.
+        """
+        keys = []
+        for i, pokemon in enumerate(candidates):
+            w = weight(pokemon) if weight else 1.0
+            if w > 0:
+                keys.append((-(random.random() ** (1.0 / w)), i))
+        heapq.heapify(keys)
         
-        # Ensure type diversity (max 2 per type)
         type_counts = {}
         selected = []
-        random.shuffle(eligible)
+        skipped = []
         
-        for pokemon in eligible:
-            if len(selected) >= 16:
-                break
-            
-            # Check type diversity
+        while keys and len(selected) < size:
+            _, i = heapq.heappop(keys)
+            pokemon = candidates[i]
             pokemon_types = pokemon.get("types", [])
-            type_ok = True
-            
-            for ptype in pokemon_types:
-                if type_counts.get(ptype, 0) >= 2:
-                    type_ok = False
-                    break
             
-            if type_ok:
+            if all(type_counts.get(ptype, 0) < 2 for ptype in pokemon_types):
                 selected.append(pokemon)
                 for ptype in pokemon_types:
                     type_counts[ptype] = type_counts.get(ptype, 0) + 1
+            elif len(skipped) < size:
+                skipped.append(pokemon)
         
-        # If we don't have 16, just take what we have or pad with random
-        if len(selected) < 16:
-            remaining = [p for p in eligible if p not in selected]
-            selected.extend(remaining[:16 - len(selected)])
-        
-        # Shuffle for random bracket seeding
-        random.shuffle(selected)
-        selected = selected[:16]
-        
-        # Create bracket structure (4 rounds)
-        # Round 1: 16 → 8 (8 matchups)
-        # Round 2: 8 → 4 (4 matchups)
-        # Round 3: 4 → 2 (2 matchups)
-        # Round 4: 2 → 1 (1 matchup)
-        
-        tournament_id = f"s{season}w{week}"
-        
-        bracket = {
-            "round_1": [],  # 8 matchups
-            "round_2": [],  # 4 matchups
-            "round_3": [],  # 2 matchups (semifinals)
-            "round_4": []   # 1 matchup (finals)
-        }
-        
-        # Create Round 1 matchups
-        for i in range(0, 16, 2):
-            matchup = {
-                "matchup_id": f"{tournament_id}_r1_m{i//2}",
-                "pokemon_a_id": selected[i]["dex_number"],
-                "pokemon_b_id": selected[i+1]["dex_number"],
-                "votes_a": 0,
-                "votes_b": 0,
-                "winner_id": None,
-                "status": "active"
-            }
-            bracket["round_1"].append(matchup)
-        
-        # Create empty future rounds (will be populated as tournament progresses)
-        for _ in range(4):
-            bracket["round_2"].append({
-                "matchup_id": f"{tournament_id}_r2_m{_}",
-                "pokemon_a_id": None,
-                "pokemon_b_id": None,
-                "votes_a": 0,
-                "votes_b": 0,
-                "winner_id": None,
-                "status": "pending"
-            })
-        
-        for _ in range(2):
-            bracket["round_3"].append({
-                "matchup_id": f"{tournament_id}_r3_m{_}",
-                "pokemon_a_id": None,
-                "pokemon_b_id": None,
-                "votes_a": 0,
-                "votes_b": 0,
-                "winner_id": None,
-                "status": "pending"
-            })
-        
-        bracket["round_4"].append({
-            "matchup_id": f"{tournament_id}_r4_m0",
-            "pokemon_a_id": None,
-            "pokemon_b_id": None,
-            "votes_a": 0,
-            "votes_b": 0,
-            "winner_id": None,
-            "status": "pending"
-        })
-        
-        tournament = {
-            "id": tournament_id,
-            "season": season,
-            "week": week,
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
-            "status": "active",
-            "current_round": 1,
-            "bracket": bracket,
-            "participants": [p["dex_number"] for p in selected],
-            "champion_id": None,
-            "created_at": now.isoformat()
-        }
-        
-        self.data["tournaments"].append(tournament)
-        self._save()
-        
-        return tournament
+        # If we don't have enough, pad with the best-ranked skipped Pokémon
+        selected.extend(skipped[:size - len(selected)])
+        return selected
     
     def get_current_round_duration(self, tournament: Dict) -> int:
         """Calculate how long each round should last (in days)."""
-        # 14 days / 4 rounds = 3.5 days per round
+        # 14 days / 4 rounds = 3.5 days per round for a 16-Pokémon bracket
         total_days = 14
-        num_rounds = 4
+        num_rounds = tournament.get("num_rounds", 4)
         return total_days / num_rounds
     
+    def get_round_deadline(self, tournament: Dict) -> datetime:
+        """Get the time the tournament's current round closes."""
+        start = datetime.fromisoformat(tournament["start_date"])
+        round_days = self.get_current_round_duration(tournament)
+        return start + timedelta(days=round_days * tournament["current_round"])
+    
+    def get_next_deadline(self) -> Optional[datetime]:
+        """Get the earliest round deadline across active tournaments."""
+        with self._lock:
+            deadlines = [
+                self.get_round_deadline(t)
+                for t in self.data["tournaments"]
+                if t["status"] == "active"
+            ]
+        return min(deadlines) if deadlines else None
+    
+    def advance_due_rounds(self, now: datetime = None) -> List[Dict]:
+        """
+        Advance every active tournament whose current round has closed.
+        
+        Rounds missed while the server was down are advanced in turn until
+        each tournament is caught up or complete.
+        
+        Returns:
+            Tournaments that advanced at least one round
+        """
+        now = now or datetime.now()
+        advanced = []
+        
+        with self._lock:
+            for tournament in list(self.data["tournaments"]):
+                moved = False
+                while tournament["status"] == "active" and self.get_round_deadline(tournament) <= now:
+                    if not self.advance_round(tournament["id"]):
+                        break
+                    moved = True
+                
+                if moved:
+                    advanced.append(tournament)
+        
+        return advanced
+    
     def advance_round(self, tournament_id: str) -> bool:
         """Advance tournament to next round based on votes."""
-        tournament = self._get_tournament_by_id(tournament_id)
-        if not tournament:
-            return False
+        with self._lock:
+            tournament = self._get_tournament_by_id(tournament_id)
+            if not tournament or tournament["status"] != "active":
+                return False
+            
+            current_round = tournament["current_round"]
+            size = tournament["bracket_size"]
+            tree = tournament["bracket_tree"]
+            bracket = tournament["bracket"]
+            
+            # Determine winners from current round; byes were decided at creation
+            for position, matchup in enumerate(bracket[f"round_{current_round}"]):
+                if matchup["status"] != "active":
+                    continue
+                
+                if matchup["votes_a"] > matchup["votes_b"]:
+                    winner_id = matchup["pokemon_a_id"]
+                elif matchup["votes_b"] > matchup["votes_a"]:
+                    winner_id = matchup["pokemon_b_id"]
+                else:
+                    # Tie - random winner
+                    winner_id = random.choice([matchup["pokemon_a_id"], matchup["pokemon_b_id"]])
+                
+                matchup["status"] = "complete"
+                advance_winner(bracket, tree, size, current_round, position, winner_id)
+                self._notify("resolved", matchup)
+            
+            if current_round < tournament["num_rounds"]:
+                # Open next round matchups, now that every winner is seated
+                for matchup in bracket[f"round_{current_round + 1}"]:
+                    matchup["status"] = "active"
+                
+                # Update current round
+                tournament["current_round"] = current_round + 1
+            else:
+                # Final decided: tournament complete
+                tournament["champion_id"] = tree[1]
+                tournament["status"] = "complete"
+            
+            self._revisions[tournament_id] = self._revisions.get(tournament_id, 0) + 1
+            
+            self._save()
+            self._refresh_matchup_index()
+            
+            if tournament["status"] == "complete":
+                self._notify("completed", tournament)
+            return True
+    
+    def get_bracket_view(self, tournament: Dict, pokedex_db) -> Dict:
+        """
+        Get a tournament with every matchup enriched with its Pokémon.
+        
+        Views are built with one batched Pokédex fetch and cached per
+        tournament until its round advances or a Hall of Fame badge changes;
+        completed tournaments stay cached until evicted, and at most
+        VIEW_CACHE_SIZE views are kept. The cached view is shared
+        and must not be mutated. Live tallies of the current round are
+        overlaid on fresh matchup dicts, and the stored tournament is never
+        touched.
+        """
+        tournament_id = tournament["id"]
+        if tournament["status"] == "complete":
+            key = ("complete",)
+        else:
+            key = (self._revisions.get(tournament_id, 0), pokedex_db.badge_revision)
         
-        current_round = tournament["current_round"]
-        round_key = f"round_{current_round}"
-        next_round_key = f"round_{current_round + 1}"
+        with self._lock:
+            cached = self._view_cache.get(tournament_id)
+            if cached is not None and cached[0] == key:
+                self._view_cache.move_to_end(tournament_id)
+                view = cached[1]
+            else:
+                view = None
+        
+        if view is None:
+            view = self._build_bracket_view(tournament, pokedex_db)
+            with self._lock:
+                self._view_cache[tournament_id] = (key, view)
+                self._view_cache.move_to_end(tournament_id)
+                if len(self._view_cache) > self.VIEW_CACHE_SIZE:
+                    self._view_cache.popitem(last=False)
+        
+        if tournament["status"] == "complete":
+            return view
+        
+        round_key = f"round_{tournament['current_round']}"
+        live = {m["matchup_id"]: m for m in tournament["bracket"].get(round_key, [])}
+        current = [
+            {**m, "votes_a": live[m["matchup_id"]]["votes_a"], "votes_b": live[m["matchup_id"]]["votes_b"]}
+            for m in view["bracket"].get(round_key, [])
+        ]
         
-        if next_round_key not in tournament["bracket"]:
-            # Tournament complete
-            return False
+        return {**view, "bracket": {**view["bracket"], round_key: current}}
+    
+    def _build_bracket_view(self, tournament: Dict, pokedex_db) -> Dict:
+        """Enrich every matchup of a tournament with one batched Pokédex fetch."""
+        dex_numbers = set()
+        for matchups in tournament["bracket"].values():
+            for matchup in matchups:
+                dex_numbers.add(matchup["pokemon_a_id"])
+                dex_numbers.add(matchup["pokemon_b_id"])
+        dex_numbers.discard(None)
         
-        # Determine winners from current round
-        current_matchups = tournament["bracket"][round_key]
-        winners = []
+        pokemon = pokedex_db.get_many(dex_numbers)
         
-        for matchup in current_matchups:
-            if matchup["votes_a"] > matchup["votes_b"]:
-                winner_id = matchup["pokemon_a_id"]
-            elif matchup["votes_b"] > matchup["votes_a"]:
-                winner_id = matchup["pokemon_b_id"]
-            else:
-                # Tie - random winner
-                winner_id = random.choice([matchup["pokemon_a_id"], matchup["pokemon_b_id"]])
-            
-            matchup["winner_id"] = winner_id
-            matchup["status"] = "complete"
-            winners.append(winner_id)
-        
-        # Populate next round matchups
-        next_matchups = tournament["bracket"][next_round_key]
-        for i, matchup in enumerate(next_matchups):
-            matchup["pokemon_a_id"] = winners[i * 2]
-            matchup["pokemon_b_id"] = winners[i * 2 + 1]
-            matchup["status"] = "active"
-        
-        # Update current round
-        tournament["current_round"] = current_round + 1
-        
-        # Check if tournament is complete
-        if current_round == 4:
-            final_matchup = tournament["bracket"]["round_4"][0]
-            if final_matchup["winner_id"]:
-                tournament["champion_id"] = final_matchup["winner_id"]
-                tournament["status"] = "complete"
+        bracket = {
+            round_key: [
+                {
+                    **matchup,
+                    "pokemon_a": pokemon.get(matchup["pokemon_a_id"]),
+                    "pokemon_b": pokemon.get(matchup["pokemon_b_id"])
+                }
+                for matchup in matchups
+            ]
+            for round_key, matchups in tournament["bracket"].items()
+        }
         
-        self._save()
-        return True
+        return {**tournament, "bracket": bracket}
     
     def _get_tournament_by_id(self, tournament_id: str) -> Optional[Dict]:
-        """Get tournament by ID."""
-        for tournament in self.data["tournaments"]:
-            if tournament["id"] == tournament_id:
-                return tournament
-        return None
+        """Get tournament by ID, from the hot store or the archive."""
+        tournament = self._by_id.get(tournament_id)
+        if tournament is None:
+            tournament = self._load_archived(tournament_id)
+        return tournament
     
     def get_active_matchups(self, tournament_id: str) -> List[Dict]:
         """Get all active matchups in current round."""
@@ -282,24 +759,63 @@ class TournamentSystem:
         matchups = tournament["bracket"].get(round_key, [])
         return [m for m in matchups if m["status"] == "active"]
     
-    def get_tournament_history(self, limit: int = 10) -> List[Dict]:
-        """Get past tournaments."""
-        sorted_tournaments = sorted(
-            self.data["tournaments"],
-            key=lambda t: t["start_date"],
-            reverse=True
-        )
-        return sorted_tournaments[:limit]
+    def get_finished_tournaments(self) -> List[Dict]:
+        """Get tournaments that are complete or whose end date has passed."""
+        now = datetime.now()
+        return [
+            t for t, end in zip(self._interval_tournaments, self._interval_ends)
+            if t["status"] == "complete" or end < now
+        ]
+    
+    def get_tournament_history(self, limit: int = 10, offset: int = 0) -> List[Dict]:
+        """
+        Get tournament summaries, newest first.
+        
+        Tournaments in the hot store come first, followed by the archive.
+        
+        Raises:
+            ValueError: If limit or offset is negative
+        """
+        if limit < 0:
+            raise ValueError("limit must not be negative")
+        if offset < 0:
+            raise ValueError("offset must not be negative")
+        
+        with self._lock:
+            hot = sorted(
+                (self._summarize(t) for t in self.data["tournaments"]),
+                key=lambda t: t["start_date"],
+                reverse=True
+            )
+            archived = self._summaries
+        
+        page = hot[offset:offset + limit]
+        
+        # Continue into the archive, which is sorted oldest first
+        skip = max(offset - len(hot), 0)
+        count = limit - len(page)
+        end = len(archived) - skip
+        if count > 0 and end > 0:
+            page.extend(reversed(archived[max(end - count, 0):end]))
+        
+        return page
+    
+    def get_tournament_count(self) -> int:
+        """Get the number of tournaments ever run."""
+        return len(self.data["tournaments"]) + len(self._summaries)
 
 
 # Global instance
 _tournament_system = None
+_tournament_system_lock = threading.Lock()
 
 def get_tournament_system() -> TournamentSystem:
     """Get global tournament system instance."""
     global _tournament_system
     if _tournament_system is None:
-        _tournament_system = TournamentSystem()
+        with _tournament_system_lock:
+            if _tournament_system is None:
+                _tournament_system = TournamentSystem()
     return _tournament_system
 
 
@@ -4,11 +4,14 @@ Stores trainer profiles and links them to their created Pokemon.
 """
 
 import json
+import threading
 import uuid
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+from src.json_store import SnapshotWriter
+
 
 class TrainerDB:
     """Manages trainer profiles."""
@@ -16,6 +19,9 @@ class TrainerDB:
     def __init__(self, db_path: str = "data/trainers.json"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(exist_ok=True)
+        self._lock = threading.RLock()
+        self._version = 0
+        self._writer = SnapshotWriter(self.db_path)
         self._load()
     
     def _load(self):
@@ -30,10 +36,16 @@ class TrainerDB:
             }
             self._save()
     
+    def _snapshot(self) -> tuple:
+        """Serialize the data under the store lock."""
+        with self._lock:
+            self._version += 1
+            return self._version, json.dumps(self.data, indent=2)
+    
     def _save(self):
         """Save database to disk."""
-        with open(self.db_path, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        version, text = self._snapshot()
+        self._writer.write(version, text)
     
     def create_trainer(self, name: str) -> dict:
         """Create a new trainer and return their profile."""
@@ -49,7 +61,8 @@ class TrainerDB:
             "shinies_found": 0,
         }
         
-        self.data["trainers"][trainer_id] = trainer
+        with self._lock:
+            self.data["trainers"][trainer_id] = trainer
         self._save()
         
         return trainer
@@ -68,38 +81,44 @@ class TrainerDB:
     
     def update_trainer(self, trainer_id: str, updates: dict) -> Optional[dict]:
         """Update trainer data."""
-        if trainer_id not in self.data["trainers"]:
-            return None
+        with self._lock:
+            if trainer_id not in self.data["trainers"]:
+                return None
+            
+            trainer = self.data["trainers"][trainer_id]
+            trainer.update(updates)
+            trainer["last_seen"] = datetime.now().isoformat()
         
-        trainer = self.data["trainers"][trainer_id]
-        trainer.update(updates)
-        trainer["last_seen"] = datetime.now().isoformat()
         self._save()
         
         return trainer
     
     def add_active_time(self, trainer_id: str, seconds: int) -> Optional[dict]:
         """Add active time to trainer."""
-        if trainer_id not in self.data["trainers"]:
-            return None
+        with self._lock:
+            if trainer_id not in self.data["trainers"]:
+                return None
+            
+            trainer = self.data["trainers"][trainer_id]
+            trainer["active_time_seconds"] = trainer.get("active_time_seconds", 0) + seconds
+            trainer["last_seen"] = datetime.now().isoformat()
         
-        trainer = self.data["trainers"][trainer_id]
-        trainer["active_time_seconds"] = trainer.get("active_time_seconds", 0) + seconds
-        trainer["last_seen"] = datetime.now().isoformat()
         self._save()
         
         return trainer
     
     def increment_pokemon_created(self, trainer_id: str, is_shiny: bool = False) -> Optional[dict]:
         """Increment Pokemon created count for trainer."""
-        if trainer_id not in self.data["trainers"]:
-            return None
+        with self._lock:
+            if trainer_id not in self.data["trainers"]:
+                return None
+            
+            trainer = self.data["trainers"][trainer_id]
+            trainer["pokemon_created"] = trainer.get("pokemon_created", 0) + 1
+            if is_shiny:
+                trainer["shinies_found"] = trainer.get("shinies_found", 0) + 1
+            trainer["last_seen"] = datetime.now().isoformat()
         
-        trainer = self.data["trainers"][trainer_id]
-        trainer["pokemon_created"] = trainer.get("pokemon_created", 0) + 1
-        if is_shiny:
-            trainer["shinies_found"] = trainer.get("shinies_found", 0) + 1
-        trainer["last_seen"] = datetime.now().isoformat()
         self._save()
         
         return trainer
@@ -144,12 +163,15 @@ class TrainerDB:
 
 # Global instance
 _db = None
+_db_lock = threading.Lock()
 
 def get_trainer_db() -> TrainerDB:
     """Get the global trainer database instance."""
     global _db
     if _db is None:
-        _db = TrainerDB()
+        with _db_lock:
+            if _db is None:
+                _db = TrainerDB()
     return _db
 
 
@@ -0,0 +1,168 @@
+"""
+PokéDream Vote Ledger
+Compact in-memory storage for one tournament's votes.
+
+Trainer and matchup IDs are interned to small integers. Each matchup side
+keeps a bitset of the trainers who voted for it, so "has voted" and the
+per-side counts are bit operations. Vote rows are stored in typed arrays
+instead of one dict per vote.
+"""
+
+from array import array
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+
+
+# Timestamps are stored as whole microseconds since this naive epoch, so
+# they round-trip exactly to the ISO strings written to the vote log
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class VoteLedger:
+    """Interned, bitset-backed vote store for a single tournament partition."""
+    
+    def __init__(self):
+        # Interned IDs
+        self._trainer_index = {}
+        self._trainers = []
+        self._matchup_index = {}
+        self._matchups = []
+        
+        # Per matchup: side pokemon_ids, one voter bitset per side, side counts
+        self._side_pokemon = []
+        self._side_bits = []
+        self._side_counts = []
+        
+        # Vote rows
+        self._row_matchup = array('H')
+        self._row_trainer = array('I')
+        self._row_side = array('B')
+        self._row_time = array('q')  # microseconds since _EPOCH
+        
+        # Per-trainer chains: last row + 1 for each trainer, previous row + 1 for each row
+        self._trainer_last_row = array('I')
+        self._row_prev = array('I')
+    
+    def __len__(self) -> int:
+        return len(self._row_matchup)
+    
+    def _intern_trainer(self, trainer_id: str) -> int:
+        """Get (or assign) the integer index for a trainer."""
+        index = self._trainer_index.get(trainer_id)
+        if index is None:
+            index = len(self._trainers)
+            self._trainer_index[trainer_id] = index
+            self._trainers.append(trainer_id)
+            self._trainer_last_row.append(0)
+        return index
+    
+    def _intern_matchup(self, matchup_id: str) -> int:
+        """Get (or assign) the integer index for a matchup."""
+        index = self._matchup_index.get(matchup_id)
+        if index is None:
+            index = len(self._matchups)
+            self._matchup_index[matchup_id] = index
+            self._matchups.append(matchup_id)
+            self._side_pokemon.append([])
+            self._side_bits.append([])
+            self._side_counts.append([])
+        return index
+    
+    def _side(self, matchup: int, pokemon_id: int) -> int:
+        """Get (or assign) the side of a matchup a Pokémon occupies."""
+        sides = self._side_pokemon[matchup]
+        try:
+            return sides.index(pokemon_id)
+        except ValueError:
+            sides.append(pokemon_id)
+            self._side_bits[matchup].append(bytearray())
+            self._side_counts[matchup].append(0)
+            return len(sides) - 1
+    
+    @staticmethod
+    def _test_bit(bits: bytearray, index: int) -> bool:
+        byte = index >> 3
+        return byte < len(bits) and bool(bits[byte] & (1 << (index & 7)))
+    
+    @staticmethod
+    def _set_bit(bits: bytearray, index: int):
+        byte = index >> 3
+        if byte >= len(bits):
+            # Grow geometrically so appends stay amortized O(1)
+            bits.extend(bytes(max(byte + 1 - len(bits), len(bits))))
+        bits[byte] |= 1 << (index & 7)
+    
+    def has_voted(self, matchup_id: str, trainer_id: str) -> bool:
+        """Check if a trainer has voted on a matchup."""
+        matchup = self._matchup_index.get(matchup_id)
+        trainer = self._trainer_index.get(trainer_id)
+        if matchup is None or trainer is None:
+            return False
+        return any(self._test_bit(bits, trainer) for bits in self._side_bits[matchup])
+    
+    def record(
+        self,
+        matchup_id: str,
+        trainer_id: str,
+        pokemon_id: int,
+        timestamp: datetime
+    ) -> bool:
+        """
+        Record a vote.
+        
+        Returns:
+            False if the trainer already voted on this matchup
+        """
+        matchup = self._intern_matchup(matchup_id)
+        trainer = self._intern_trainer(trainer_id)
+        
+        if any(self._test_bit(bits, trainer) for bits in self._side_bits[matchup]):
+            return False
+        
+        side = self._side(matchup, pokemon_id)
+        self._set_bit(self._side_bits[matchup][side], trainer)
+        self._side_counts[matchup][side] += 1
+        
+        self._row_prev.append(self._trainer_last_row[trainer])
+        self._trainer_last_row[trainer] = len(self._row_matchup) + 1
+        self._row_matchup.append(matchup)
+        self._row_trainer.append(trainer)
+        self._row_side.append(side)
+        self._row_time.append((timestamp - _EPOCH) // _MICROSECOND)
+        return True
+    
+    def get_matchup_counts(self, matchup_id: str) -> Optional[Dict[int, int]]:
+        """Get vote counts per Pokémon for a matchup, or None if it has no votes."""
+        matchup = self._matchup_index.get(matchup_id)
+        if matchup is None:
+            return None
+        return dict(zip(self._side_pokemon[matchup], self._side_counts[matchup]))
+    
+    def _row(self, row: int) -> Dict:
+        """Expand a stored row back into a vote dict."""
+        matchup = self._row_matchup[row]
+        return {
+            "matchup_id": self._matchups[matchup],
+            "trainer_id": self._trainers[self._row_trainer[row]],
+            "pokemon_id": self._side_pokemon[matchup][self._row_side[row]],
+            "timestamp": (_EPOCH + self._row_time[row] * _MICROSECOND).isoformat()
+        }
+    
+    def get_trainer_votes(self, trainer_id: str) -> List[Dict]:
+        """Get all votes by a trainer in this partition."""
+        trainer = self._trainer_index.get(trainer_id)
+        if trainer is None:
+            return []
+        
+        votes = []
+        link = self._trainer_last_row[trainer]
+        while link:
+            votes.append(self._row(link - 1))
+            link = self._row_prev[link - 1]
+        votes.reverse()
+        return votes
+    
+    def __iter__(self) -> Iterator[Dict]:
+        for row in range(len(self._row_matchup)):
+            yield self._row(row)
@@ -1,43 +1,253 @@
 """
 PokéDream Voting System
 Tracks votes and prevents duplicate voting.
+
+Votes are stored as an append-only ledger partitioned by tournament:
+
+    data/votes/<tournament_id>.jsonl              active partition, one vote per line
+    data/votes/archive/<tournament_id>.json       sealed tallies
+    data/votes/archive/<tournament_id>.votes.jsonl  sealed vote rows (compact arrays)
+
+Only unsealed partitions are kept in memory (as compact VoteLedgers) and
+written to. Sealed tournaments contribute their precomputed tallies to the
+counters.
+
+Votes are validated and counted in memory, acknowledged immediately and
+handed to a background writer that group-commits them every few
+milliseconds (or every `batch_size` votes) with one fsync per partition.
 """
 
 import json
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, List
 
+from src.vote_ledger import VoteLedger
+
 
 class VotingSystem:
     """Manages tournament votes."""
     
-    def __init__(self, db_path: str = "data/votes.json"):
+    SEALED_CACHE_SIZE = 32  # sealed tournaments whose vote rows stay loaded
+    
+    def __init__(
+        self,
+        db_path: str = "data/votes",
+        legacy_path: str = "data/votes.json",
+        flush_interval: float = 0.005,
+        batch_size: int = 256
+    ):
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(exist_ok=True)
+        self.archive_path = self.db_path / "archive"
+        self.legacy_path = Path(legacy_path)
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._listeners = []
+        # Partitions popped from memory but not yet archived: tournament_id -> VoteLedger
+        self._sealing = {}
         self._load()
+        
+        # Group commit: votes are queued here and persisted by the writer thread
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, name="vote-writer", daemon=True)
+        self._writer.start()
     
     def _load(self):
-        """Load votes from disk."""
-        if self.db_path.exists():
-            with open(self.db_path, 'r') as f:
-                self.data = json.load(f)
-        else:
-            self.data = {
-                "votes": [],
-                "created_at": datetime.now().isoformat()
+        """Load active partitions and sealed tallies from disk."""
+        if not self.db_path.exists():
+            self.archive_path.mkdir(parents=True, exist_ok=True)
+            self._migrate_legacy()
+        self.archive_path.mkdir(parents=True, exist_ok=True)
+        
+        # Sealed tournaments: tournament_id -> tallies
+        self.sealed = {}
+        # Sealed vote rows read back on demand: tournament_id -> trainer_id -> votes
+        self._sealed_votes = OrderedDict()
+        for archive in sorted(self.archive_path.glob("*.json")):
+            with open(archive, 'r') as f:
+                self.sealed[archive.stem] = json.load(f)
+        
+        self._build_indexes()
+        
+        # Hot partitions: tournament_id -> VoteLedger
+        self.partitions = {}
+        for log_path in sorted(self.db_path.glob("*.jsonl")):
+            # A tournament can be in both stores if the process died mid-seal
+            if log_path.stem in self.sealed:
+                log_path.unlink()
+                continue
+            
+            ledger = VoteLedger()
+            with open(log_path, 'r') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    vote = json.loads(line)
+                    if ledger.record(
+                        vote["matchup_id"],
+                        vote["trainer_id"],
+                        vote["pokemon_id"],
+                        datetime.fromisoformat(vote["timestamp"])
+                    ):
+                        self._index_vote(vote)
+            self.partitions[log_path.stem] = ledger
+    
+    def _migrate_legacy(self):
+        """Split a legacy single-file votes.json into per-tournament partitions."""
+        if not self.legacy_path.exists():
+            return
+        
+        with open(self.legacy_path, 'r') as f:
+            legacy = json.load(f)
+        
+        partitions = {}
+        for vote in legacy.get("votes", []):
+            tournament_id = self._tournament_id(vote["matchup_id"])
+            partitions.setdefault(tournament_id, []).append(vote)
+        
+        for tournament_id, votes in partitions.items():
+            with open(self._partition_path(tournament_id), 'w') as f:
+                for vote in votes:
+                    f.write(json.dumps(vote) + "\n")
+    
+    def _build_indexes(self):
+        """Rebuild per-trainer and per-Pokémon vote counters from sealed tallies."""
+        self._trainer_votes = {}
+        self._trainer_tournaments = {}
+        self._pokemon_votes = {}
+        self._pokemon_tournament_votes = {}
+        self._sealed_matchup_votes = {}
+        
+        for tournament_id, tallies in self.sealed.items():
+            self._index_tallies(tournament_id, tallies)
+    
+    def _index_vote(self, vote: Dict):
+        """Add a single vote to the in-memory counters."""
+        trainer_id = vote["trainer_id"]
+        pokemon_id = vote["pokemon_id"]
+        tournament_id = self._tournament_id(vote["matchup_id"])
+        
+        self._trainer_votes[trainer_id] = self._trainer_votes.get(trainer_id, 0) + 1
+        self._trainer_tournaments.setdefault(trainer_id, set()).add(tournament_id)
+        self._pokemon_votes[pokemon_id] = self._pokemon_votes.get(pokemon_id, 0) + 1
+        key = (pokemon_id, tournament_id)
+        self._pokemon_tournament_votes[key] = self._pokemon_tournament_votes.get(key, 0) + 1
+    
+    def _index_tallies(self, tournament_id: str, tallies: Dict):
+        """Add a sealed tournament's precomputed tallies to the counters."""
+        for trainer_id, count in tallies["trainers"].items():
+            self._trainer_votes[trainer_id] = self._trainer_votes.get(trainer_id, 0) + count
+            self._trainer_tournaments.setdefault(trainer_id, set()).add(tournament_id)
+        
+        for pokemon_key, count in tallies["pokemon"].items():
+            pokemon_id = int(pokemon_key)
+            self._pokemon_votes[pokemon_id] = self._pokemon_votes.get(pokemon_id, 0) + count
+            self._pokemon_tournament_votes[(pokemon_id, tournament_id)] = count
+        
+        for matchup_id, counts in tallies["matchups"].items():
+            self._sealed_matchup_votes[matchup_id] = {
+                int(pokemon_key): count for pokemon_key, count in counts.items()
             }
-            self._save()
     
-    def _save(self):
-        """Save votes to disk."""
-        with open(self.db_path, 'w') as f:
-            json.dump(self.data, f, indent=2)
+    @staticmethod
+    def _tournament_id(matchup_id: str) -> str:
+        """Extract the tournament ID from a matchup ID (e.g. "s1w1_r1_m0" -> "s1w1")."""
+        return matchup_id.split("_")[0]
+    
+    def _partition_path(self, tournament_id: str) -> Path:
+        """Path of a tournament's active partition log."""
+        return self.db_path / f"{tournament_id}.jsonl"
+    
+    def _writer_loop(self):
+        """Drain the vote queue in batches and append them to partition logs."""
+        # Queue items are lists of votes; None stops the writer
+        while True:
+            votes = self._queue.get()
+            if votes is None:
+                self._queue.task_done()
+                return
+            
+            batch = list(votes)
+            items = 1
+            deadline = time.monotonic() + self.flush_interval
+            stop = False
+            
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    votes = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                items += 1
+                if votes is None:
+                    stop = True
+                    break
+                batch.extend(votes)
+            
+            # These votes were already acknowledged, so keep retrying rather
+            # than drop them. A retry may repeat lines of a partially written
+            # batch; the ledger ignores the repeats on load.
+            attempt = 0
+            while True:
+                try:
+                    self._write_batch(batch)
+                    break
+                except Exception as e:
+                    attempt += 1
+                    print(f"⚠ Failed to persist {len(batch)} votes (attempt {attempt}), retrying: {e}")
+                    time.sleep(min(0.1 * 2 ** attempt, 30.0))
+            
+            for _ in range(items):
+                self._queue.task_done()
+            
+            if stop:
+                return
+    
+    def _write_batch(self, votes: List[Dict]):
+        """Append a batch of votes, grouped by partition, with one fsync per file."""
+        by_partition = {}
+        for vote in votes:
+            tournament_id = self._tournament_id(vote["matchup_id"])
+            by_partition.setdefault(tournament_id, []).append(json.dumps(vote) + "\n")
+        
+        for tournament_id, lines in by_partition.items():
+            with open(self._partition_path(tournament_id), 'a') as f:
+                f.write("".join(lines))
+                f.flush()
+                os.fsync(f.fileno())
+    
+    def subscribe(self, callback):
+        """
+        Register a callback(matchup_id, pokemon_id) run for every accepted vote.
+        
+        Callbacks run while the vote lock is held, so they see votes one at a
+        time and in order. They must be quick and must not call back into
+        the voting system.
+        """
+        self._listeners.append(callback)
+    
+    def flush(self):
+        """Block until every acknowledged vote has been written to disk."""
+        self._queue.join()
+    
+    def close(self):
+        """Flush pending votes and stop the writer thread."""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
     
     def cast_vote(
-        self, 
-        matchup_id: str, 
-        trainer_id: str, 
+        self,
+        matchup_id: str,
+        trainer_id: str,
         pokemon_id: int
     ) -> Dict[str, any]:
         """
@@ -46,23 +256,72 @@ class VotingSystem:
         Returns:
             Dict with success status and message
         """
-        # Check if trainer already voted on this matchup
-        if self.has_voted(matchup_id, trainer_id):
+        with self._lock:
+            result = self._record_vote(matchup_id, trainer_id, pokemon_id)
+            
+            # Persisted by the writer thread within flush_interval. Queued
+            # under the lock so seal_tournament's flush can't miss it.
+            if result["success"]:
+                self._queue.put([result["vote"]])
+        
+        return result
+    
+    def cast_votes(self, trainer_id: str, picks: List[Dict]) -> List[Dict]:
+        """
+        Cast several votes for one trainer and persist them in a single write.
+        
+        Args:
+            trainer_id: Voting trainer
+            picks: List of {"matchup_id", "pokemon_id"} dicts
+        
+        Returns:
+            One result dict per pick, in order, with the matchup_id attached
+        """
+        results = []
+        
+        with self._lock:
+            for pick in picks:
+                result = self._record_vote(pick["matchup_id"], trainer_id, pick["pokemon_id"])
+                results.append({"matchup_id": pick["matchup_id"], **result})
+            
+            accepted = [r["vote"] for r in results if r["success"]]
+            if accepted:
+                self._queue.put(accepted)
+        
+        return results
+    
+    def _record_vote(self, matchup_id: str, trainer_id: str, pokemon_id: int) -> Dict[str, any]:
+        """Validate and count a vote in memory. Caller must hold the lock."""
+        tournament_id = self._tournament_id(matchup_id)
+        
+        if tournament_id in self.sealed:
+            return {
+                "success": False,
+                "message": "Voting for this tournament has closed"
+            }
+        
+        ledger = self.partitions.get(tournament_id)
+        if ledger is None:
+            ledger = self.partitions[tournament_id] = VoteLedger()
+        
+        # Record vote (the ledger rejects a second vote on the same matchup)
+        now = datetime.now()
+        if not ledger.record(matchup_id, trainer_id, pokemon_id, now):
             return {
                 "success": False,
                 "message": "You already voted on this matchup"
             }
         
-        # Record vote
         vote = {
             "matchup_id": matchup_id,
             "trainer_id": trainer_id,
             "pokemon_id": pokemon_id,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now.isoformat()
         }
+        self._index_vote(vote)
         
-        self.data["votes"].append(vote)
-        self._save()
+        for callback in self._listeners:
+            callback(matchup_id, pokemon_id)
         
         return {
             "success": True,
@@ -70,64 +329,179 @@ class VotingSystem:
             "vote": vote
         }
     
+    def _ledger(self, tournament_id: str) -> Optional[VoteLedger]:
+        """Get a tournament's in-memory ledger, including one being sealed."""
+        ledger = self.partitions.get(tournament_id)
+        if ledger is None:
+            ledger = self._sealing.get(tournament_id)
+        return ledger
+    
     def has_voted(self, matchup_id: str, trainer_id: str) -> bool:
         """Check if trainer has already voted on a matchup."""
-        for vote in self.data["votes"]:
-            if (vote["matchup_id"] == matchup_id and 
-                vote["trainer_id"] == trainer_id):
-                return True
-        return False
+        tournament_id = self._tournament_id(matchup_id)
+        
+        ledger = self._ledger(tournament_id)
+        if ledger is not None:
+            return ledger.has_voted(matchup_id, trainer_id)
+        
+        if tournament_id not in self.sealed:
+            return False
+        
+        return any(
+            vote["matchup_id"] == matchup_id
+            for vote in self.get_trainer_votes(trainer_id, tournament_id)
+        )
     
     def get_matchup_votes(self, matchup_id: str) -> Dict[int, int]:
         """Get vote counts for a matchup."""
-        counts = {}
-        
-        for vote in self.data["votes"]:
-            if vote["matchup_id"] == matchup_id:
-                pokemon_id = vote["pokemon_id"]
-                counts[pokemon_id] = counts.get(pokemon_id, 0) + 1
-        
-        return counts
+        ledger = self._ledger(self._tournament_id(matchup_id))
+        if ledger is not None:
+            return ledger.get_matchup_counts(matchup_id) or {}
+        return dict(self._sealed_matchup_votes.get(matchup_id, {}))
     
     def get_trainer_votes(self, trainer_id: str, tournament_id: str) -> List[Dict]:
         """Get all votes by a trainer in a tournament."""
-        return [
-            vote for vote in self.data["votes"]
-            if (vote["trainer_id"] == trainer_id and 
-                vote["matchup_id"].startswith(tournament_id))
-        ]
+        ledger = self._ledger(tournament_id)
+        if ledger is not None:
+            return ledger.get_trainer_votes(trainer_id)
+        
+        if self.sealed.get(tournament_id) is None:
+            return []
+        return list(self._load_sealed_votes(tournament_id).get(trainer_id, []))
     
     def get_pokemon_total_votes(self, pokemon_id: int) -> int:
         """Get total votes a Pokémon has received across all tournaments."""
-        return len([
-            vote for vote in self.data["votes"]
-            if vote["pokemon_id"] == pokemon_id
-        ])
+        return self._pokemon_votes.get(pokemon_id, 0)
+    
+    def get_pokemon_tournament_votes(self, pokemon_id: int, tournament_id: str) -> int:
+        """Get votes a Pokémon received in a specific tournament."""
+        return self._pokemon_tournament_votes.get((pokemon_id, tournament_id), 0)
     
     def get_trainer_voting_stats(self, trainer_id: str) -> Dict:
         """Get voting statistics for a trainer."""
-        trainer_votes = [
-            vote for vote in self.data["votes"]
-            if vote["trainer_id"] == trainer_id
-        ]
-        
         return {
-            "total_votes": len(trainer_votes),
-            "tournaments_participated": len(set(
-                vote["matchup_id"].split("_")[0] 
-                for vote in trainer_votes
-            ))
+            "total_votes": self._trainer_votes.get(trainer_id, 0),
+            "tournaments_participated": len(self._trainer_tournaments.get(trainer_id, ()))
         }
+    
+    # ==================== ARCHIVAL ====================
+    
+    def is_sealed(self, tournament_id: str) -> bool:
+        """Check if a tournament's votes have been archived."""
+        return tournament_id in self.sealed
+    
+    def seal_tournament(self, tournament_id: str) -> Optional[Dict]:
+        """
+        Archive a completed tournament's partition.
+        
+        Writes the precomputed tallies and compact vote rows to the archive,
+        removes the hot log and drops the partition from memory.
+        
+        Returns:
+            The sealed tallies, or None if already sealed
+        """
+        with self._lock:
+            if tournament_id in self.sealed:
+                return None
+            # Reject new votes while the partition is being archived
+            self.sealed[tournament_id] = None
+            ledger = self.partitions.pop(tournament_id, None)
+            if ledger is not None:
+                self._sealing[tournament_id] = ledger
+        
+        self.flush()
+        votes = list(ledger) if ledger is not None else []
+        
+        matchups = {}
+        pokemon = {}
+        trainers = {}
+        for vote in votes:
+            counts = matchups.setdefault(vote["matchup_id"], {})
+            pokemon_key = str(vote["pokemon_id"])
+            counts[pokemon_key] = counts.get(pokemon_key, 0) + 1
+            pokemon[pokemon_key] = pokemon.get(pokemon_key, 0) + 1
+            trainers[vote["trainer_id"]] = trainers.get(vote["trainer_id"], 0) + 1
+        
+        tallies = {
+            "tournament_id": tournament_id,
+            "sealed_at": datetime.now().isoformat(),
+            "total_votes": len(votes),
+            "matchups": matchups,
+            "pokemon": pokemon,
+            "trainers": trainers,
+        }
+        
+        # Compact rows: [matchup_id, trainer_id, pokemon_id, timestamp]
+        rows_path = self.archive_path / f"{tournament_id}.votes.jsonl"
+        with open(rows_path, 'w') as f:
+            for vote in votes:
+                f.write(json.dumps([
+                    vote["matchup_id"],
+                    vote["trainer_id"],
+                    vote["pokemon_id"],
+                    vote["timestamp"]
+                ]) + "\n")
+        
+        tallies_path = self.archive_path / f"{tournament_id}.json"
+        tmp_path = tallies_path.with_suffix(".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(tallies, f)
+        os.replace(tmp_path, tallies_path)
+        
+        partition_path = self._partition_path(tournament_id)
+        if partition_path.exists():
+            partition_path.unlink()
+        
+        with self._lock:
+            self.sealed[tournament_id] = tallies
+            self._sealing.pop(tournament_id, None)
+            self._sealed_matchup_votes.update({
+                matchup_id: {int(key): count for key, count in counts.items()}
+                for matchup_id, counts in matchups.items()
+            })
+        
+        return tallies
+    
+    def _load_sealed_votes(self, tournament_id: str) -> Dict[str, List[Dict]]:
+        """Read a sealed tournament's vote rows back, grouped by trainer."""
+        with self._lock:
+            votes = self._sealed_votes.get(tournament_id)
+            if votes is not None:
+                self._sealed_votes.move_to_end(tournament_id)
+                return votes
+            
+            votes = {}
+            rows_path = self.archive_path / f"{tournament_id}.votes.jsonl"
+            if rows_path.exists():
+                with open(rows_path, 'r') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        matchup_id, trainer_id, pokemon_id, timestamp = json.loads(line)
+                        votes.setdefault(trainer_id, []).append({
+                            "matchup_id": matchup_id,
+                            "trainer_id": trainer_id,
+                            "pokemon_id": pokemon_id,
+                            "timestamp": timestamp
+                        })
+            
+            self._sealed_votes[tournament_id] = votes
+            if len(self._sealed_votes) > self.SEALED_CACHE_SIZE:
+                self._sealed_votes.popitem(last=False)
+            return votes
 
 
 # Global instance
 _voting_system = None
+_voting_system_lock = threading.Lock()
 
 def get_voting_system() -> VotingSystem:
     """Get global voting system instance."""
     global _voting_system
     if _voting_system is None:
-        _voting_system = VotingSystem()
+        with _voting_system_lock:
+            if _voting_system is None:
+                _voting_system = VotingSystem()
     return _voting_system
 
 
@@ -153,4 +527,4 @@ if __name__ == "__main__":
     
     # Get counts
     counts = system.get_matchup_votes("s1w1_r1_m0")
-    print(f"Matchup votes: {counts}")
\ No newline at end of file
+    print(f"Matchup votes: {counts}")